@@ -0,0 +1,58 @@
+"""
+    python -m benchmarks run [--output results.json] [--yaml-sizes 10KB,1MB,50MB]
+    python -m benchmarks compare baseline.json current.json [--threshold 0.1]
+
+'compare' exits with status 1 if a metric regressed by more than the threshold.
+"""
+import argparse
+import json
+import sys
+
+from .suite import compare, run
+
+_UNITS = {"KB": 1 / 1024, "MB": 1.0}
+
+
+def parse_sizes(sizes: str):
+    parsed = {}
+    for size in sizes.split(","):
+        size = size.strip().upper()
+        parsed[size] = float(size[:-2]) * _UNITS[size[-2:]]
+    return parsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmark suite and write the results as JSON")
+    run_parser.add_argument("--output", "-o", help="file to write the results to, defaults to stdout")
+    run_parser.add_argument("--yaml-sizes", default="10KB,1MB", help="comma separated YAML file sizes (KB/MB)")
+
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.1,
+                                help="relative slowdown counted as regression, 0.1 = 10%%")
+
+    arguments = parser.parse_args()
+    if arguments.command == "run":
+        results = json.dumps(run(parse_sizes(arguments.yaml_sizes)), indent=2)
+        if arguments.output:
+            with open(arguments.output, "w") as file:
+                file.write(results + "\n")
+        else:
+            print(results)
+        return 0
+
+    with open(arguments.baseline) as file:
+        baseline = json.load(file)
+    with open(arguments.current) as file:
+        current = json.load(file)
+    lines = compare(baseline, current, arguments.threshold)
+    print("\n".join(lines))
+    return 1 if any(line.startswith("REGRESSION") for line in lines) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
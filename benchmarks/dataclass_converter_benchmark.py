@@ -0,0 +1,66 @@
+"""
+Compares DataclassConverter.convert against the previous reflective implementation, which called
+'inspect.signature' on every conversion.
+
+    python benchmarks/dataclass_converter_benchmark.py [--fields 60] [--number 2000]
+"""
+import argparse
+import inspect
+import os
+import sys
+import timeit
+from dataclasses import make_dataclass
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from context_configuration.converter.dataclass_converter import DataclassConverter  # noqa: E402
+
+
+def reflective_convert(cls, properties):
+    sig = inspect.signature(cls)
+    kw_arguments = {}
+    for param in sig.parameters.values():
+        if param.name not in properties:
+            if param.default != inspect.Parameter.empty:
+                properties[param.name] = param.default
+                continue
+            raise ValueError(f"Required key '{param.name}' not found in configuration parameters.")
+        if type(properties[param.name]) != param.annotation:
+            raise ValueError(f"Required key '{param.name}' is of wrong type.")
+        kw_arguments[param.name] = properties[param.name]
+    return cls(**kw_arguments)
+
+
+def wide_dataclass(field_count: int):
+    field_types = (str, int, float)
+    return make_dataclass(f"Wide{field_count}", [
+        (f"field_{i}", field_types[i % 3]) for i in range(field_count)
+    ])
+
+
+def wide_properties(field_count: int):
+    values = ("value", 1, 1.5)
+    return {f"field_{i}": values[i % 3] for i in range(field_count)}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fields", type=int, default=60)
+    parser.add_argument("--number", type=int, default=2000)
+    arguments = parser.parse_args()
+
+    cls = wide_dataclass(arguments.fields)
+    properties = wide_properties(arguments.fields)
+    converter = DataclassConverter(cls)
+
+    reflective = min(timeit.repeat(lambda: reflective_convert(cls, properties), number=arguments.number, repeat=5))
+    compiled = min(timeit.repeat(lambda: converter.convert(properties), number=arguments.number, repeat=5))
+
+    print(f"fields:      {arguments.fields}")
+    print(f"reflective:  {reflective / arguments.number * 1e6:8.2f} us/conversion")
+    print(f"compiled:    {compiled / arguments.number * 1e6:8.2f} us/conversion")
+    print(f"speedup:     {reflective / compiled:8.2f}x")
+
+
+if __name__ == '__main__':
+    main()
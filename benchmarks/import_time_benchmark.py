@@ -0,0 +1,62 @@
+"""
+Reports the import time of context_configuration measured with 'python -X importtime', for a bare package import,
+a process using only the environment variable source and a process importing every exported name.
+
+    python benchmarks/import_time_benchmark.py [--repeat 5]
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, Set
+
+SOURCE_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+SCENARIOS = {
+    "package": "import context_configuration",
+    "env_vars": "from context_configuration import EnvVarsPropertySource",
+    "all_names": "from context_configuration import *",
+}
+
+
+def _top_level_imports(statement: str) -> Dict[str, int]:
+    """ Returns the cumulative import time in microseconds of every module imported directly by the interpreter. """
+    environment = dict(os.environ, PYTHONPATH=SOURCE_DIRECTORY)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], env=environment,
+                            capture_output=True, text=True, check=True)
+    imports = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            imports[name.strip()] = int(cumulative)
+    return imports
+
+
+def import_time(statement: str, startup_modules: Set[str], repeat: int) -> float:
+    """ Returns the best import time in seconds of the modules the statement imports beyond interpreter startup. """
+    best = None
+    for _ in range(repeat):
+        imports = _top_level_imports(statement)
+        microseconds = sum(time for name, time in imports.items() if name not in startup_modules)
+        best = microseconds if best is None else min(best, microseconds)
+    return best / 1e6
+
+
+def import_times(repeat: int = 5) -> Dict[str, float]:
+    startup_modules = set(_top_level_imports("pass"))
+    return {name: import_time(statement, startup_modules, repeat) for name, statement in SCENARIOS.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+
+    for name, seconds in import_times(arguments.repeat).items():
+        print(f"{name:<10} {seconds * 1000:8.2f} ms  ({SCENARIOS[name]})")
+
+
+if __name__ == '__main__':
+    main()
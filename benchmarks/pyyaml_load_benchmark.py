@@ -0,0 +1,57 @@
+"""
+Reports the load time of PyYAMLPropertySource for a generated YAML file, comparing the pure Python loader
+with the libyaml based one used by the property source.
+
+    python benchmarks/pyyaml_load_benchmark.py [--megabytes 4]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import yaml
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from context_configuration.property_source.pyyaml_property_source import PyYAMLPropertySource  # noqa: E402
+
+
+def write_yaml_file(path: str, megabytes: float) -> None:
+    target_size = int(megabytes * 1024 * 1024)
+    with open(path, "w") as file:
+        section = 0
+        while file.tell() < target_size:
+            file.write(f"section_{section}:\n")
+            for key in range(50):
+                file.write(f"  key_{key}:\n    name: \"value {section}-{key}\"\n    size: {key}\n    ratio: {key / 7}\n")
+            section += 1
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--megabytes", type=float, default=4)
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "application-benchmark.yaml")
+        write_yaml_file(path, arguments.megabytes)
+
+        start = time.perf_counter()
+        with open(path, "rb") as file:
+            yaml.load(file, Loader=yaml.SafeLoader)
+        pure_python = time.perf_counter() - start
+
+        lazy_source = PyYAMLPropertySource(path, lazy=True)
+        start = time.perf_counter()
+        lazy_source.contains_property("section_0.key_0.name")
+        first_access = time.perf_counter() - start
+
+        print(f"file size:          {os.path.getsize(path) / 1024 / 1024:8.2f} MB")
+        print(f"libyaml available:  {yaml.__with_libyaml__}")
+        print(f"SafeLoader:         {pure_python:8.3f} s")
+        print(f"property source:    {lazy_source.load_time:8.3f} s (first lazy access {first_access:.3f} s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,182 @@
+"""
+Benchmark suite for context_configuration, using only the standard library.
+
+Every metric is the best time in seconds per operation over several repeats, lower is better.
+"""
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+import timeit
+from dataclasses import make_dataclass
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from context_configuration.context_configuration import ContextConfiguration, Property  # noqa: E402
+from context_configuration.converter.dataclass_converter import DataclassConverter  # noqa: E402
+from context_configuration.converter.numeric_array_converter import convert_float_array, convert_int_array  # noqa: E402
+from context_configuration.parsed_config_cache import ParsedConfigCache  # noqa: E402
+from context_configuration.property_source.cli_property_source import CLIPropertySource  # noqa: E402
+from context_configuration.property_source.dictionary_property_source import DictionaryPropertySource  # noqa: E402
+from context_configuration.property_source.pyyaml_property_source import PyYAMLPropertySource  # noqa: E402
+from context_configuration.property_source.streaming_pyyaml_property_source import (  # noqa: E402
+    StreamingPyYAMLPropertySource,
+)
+
+from .dataclass_converter_benchmark import wide_dataclass, wide_properties  # noqa: E402
+from .import_time_benchmark import import_times  # noqa: E402
+from .pyyaml_load_benchmark import write_yaml_file  # noqa: E402
+
+
+def measure(operation: Callable[[], object], number: int, repeat: int = 5) -> float:
+    return min(timeit.repeat(operation, number=number, repeat=repeat)) / number
+
+
+def nested_properties(depth: int, value: str) -> Dict:
+    properties = {"leaf": value}
+    for level in reversed(range(depth - 1)):
+        properties = {f"level_{level}": properties}
+    return properties
+
+
+def nested_key(depth: int) -> str:
+    return ".".join([f"level_{level}" for level in range(depth - 1)] + ["leaf"])
+
+
+def lookup_benchmarks(depths: List[int], source_counts: List[int]) -> Dict[str, float]:
+    metrics = {}
+    for depth in depths:
+        for source_count in source_counts:
+            sources = [DictionaryPropertySource({f"other_{number}": "value"}) for number in range(source_count - 1)]
+            sources.append(DictionaryPropertySource(nested_properties(depth, "value")))
+            configuration = ContextConfiguration(sources, {})
+            key = nested_key(depth)
+
+            def uncached():
+                configuration.invalidate_cache()
+                configuration.get_property(key, str)
+
+            name = f"depth{depth}.sources{source_count}"
+            metrics[f"lookup.uncached.{name}"] = measure(uncached, number=2000)
+            metrics[f"lookup.cached.{name}"] = measure(lambda: configuration.get_property(key, str), number=20000)
+    return metrics
+
+
+def yaml_benchmarks(sizes: Dict[str, float]) -> Dict[str, float]:
+    metrics = {}
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ParsedConfigCache(os.path.join(directory, "cache"))
+        for label, megabytes in sizes.items():
+            path = os.path.join(directory, f"application-{label}.yaml")
+            write_yaml_file(path, megabytes)
+            number = 1 if megabytes >= 1 else 20
+            repeat = 1 if megabytes >= 10 else 3
+            metrics[f"yaml.cold.{label}"] = measure(lambda: PyYAMLPropertySource(path), number, repeat)
+            PyYAMLPropertySource(path, cache=cache)
+            metrics[f"yaml.warm.{label}"] = measure(lambda: PyYAMLPropertySource(path, cache=cache), number, repeat)
+            metrics[f"yaml.streaming.{label}"] = measure(
+                lambda: StreamingPyYAMLPropertySource(path).get_property("section_0.key_0.name"), number, repeat)
+    return metrics
+
+
+def dataclass_benchmarks() -> Dict[str, float]:
+    wide = wide_dataclass(60)
+    wide_converter = DataclassConverter(wide)
+    properties = wide_properties(60)
+
+    nested = make_dataclass("Nested0", [("name", str)])
+    nested_value = {"name": "leaf"}
+    for level in range(1, 6):
+        nested = make_dataclass(f"Nested{level}", [("name", str), ("child", nested)])
+        nested_value = {"name": f"level {level}", "child": nested_value}
+    nested_converter = DataclassConverter(nested)
+
+    return {
+        "dataclass.wide60": measure(lambda: wide_converter.convert(properties), number=2000),
+        "dataclass.nested6": measure(lambda: nested_converter.convert(nested_value), number=5000),
+    }
+
+
+def array_benchmarks(length: int = 100000) -> Dict[str, float]:
+    ints = list(range(length))
+    floats = [number / 3 for number in ints]
+    return {
+        f"convert.int_array.{length}": measure(lambda: convert_int_array(ints), number=20),
+        f"convert.float_array.{length}": measure(lambda: convert_float_array(floats), number=20),
+    }
+
+
+def bean_benchmarks(thread_count: int = 8, calls: int = 20000) -> Dict[str, float]:
+    configuration = ContextConfiguration([DictionaryPropertySource({"a": "value"})], {})
+
+    @configuration.properties([Property("value", "a", str)], is_singleton=True)
+    def bean(value):
+        return object()
+
+    def access():
+        barrier.wait()
+        for _ in range(calls):
+            bean()
+
+    best = None
+    for _ in range(3):
+        barrier = threading.Barrier(thread_count + 1)
+        threads = [threading.Thread(target=access) for _ in range(thread_count)]
+        for thread in threads:
+            thread.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for thread in threads:
+            thread.join()
+        duration = (time.perf_counter() - start) / (thread_count * calls)
+        best = duration if best is None else min(best, duration)
+    return {f"beans.singleton.threads{thread_count}": best}
+
+
+def cli_benchmarks(override_count: int = 10000) -> Dict[str, float]:
+    argv = []
+    for number in range(override_count):
+        argv += [f"--group_{number % 100}.key_{number}", str(number)]
+    return {f"cli.parse.{override_count}": measure(lambda: CLIPropertySource(argv), number=1, repeat=3)}
+
+
+def import_benchmarks() -> Dict[str, float]:
+    return {f"import.{name}": seconds for name, seconds in import_times(repeat=3).items()}
+
+
+def run(yaml_sizes: Dict[str, float]) -> Dict:
+    metrics = import_benchmarks()
+    metrics.update(lookup_benchmarks(depths=[1, 4, 8], source_counts=[1, 4, 16]))
+    metrics.update(yaml_benchmarks(yaml_sizes))
+    metrics.update(dataclass_benchmarks())
+    metrics.update(array_benchmarks())
+    metrics.update(bean_benchmarks())
+    metrics.update(cli_benchmarks())
+    return {
+        "metadata": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "metrics": metrics,
+    }
+
+
+def compare(baseline: Dict, current: Dict, threshold: float) -> List[str]:
+    """ Returns a line per metric present in both results, marking metrics slower than the baseline by more than
+        'threshold' (0.1 = 10%) with 'REGRESSION'.
+    """
+    lines = []
+    for name, baseline_value in sorted(baseline["metrics"].items()):
+        current_value = current["metrics"].get(name)
+        if current_value is None or baseline_value <= 0:
+            continue
+        change = current_value / baseline_value - 1
+        status = "REGRESSION" if change > threshold else "ok"
+        lines.append(f"{status:<10} {name:<40} {baseline_value * 1e6:12.3f} us -> {current_value * 1e6:12.3f} us "
+                     f"({change:+.1%})")
+    return lines
@@ -1,18 +1,42 @@
-from .converter import DataclassConverter, IsoFormatDateTimeConverter
-from .property_source import AbstractPropertySource, CLIPropertySource, DictionaryPropertySource, EnvVarsPropertySource, PyYAMLPropertySource
-from .protocol import T, Converter, P, PropertySource, OrderedPropertySource
+from typing import TYPE_CHECKING
+
+from ._lazy_imports import lazy_attributes
+
+if TYPE_CHECKING:
+    from .converter import DataclassConverter, IsoFormatDateTimeConverter
+    from .property_source import AbstractPropertySource, CLIPropertySource, DictionaryPropertySource, \
+        EnvVarsPropertySource, PyYAMLPropertySource
+    from .protocol import T, Converter, P, PropertySource, OrderedPropertySource
+
+# names are imported on first access, so e.g. PyYAML is only loaded by processes using the YAML property source
+_IMPORTS = {
+    "DataclassConverter": ".converter.dataclass_converter",
+    "IsoFormatDateTimeConverter": ".converter.iso_format_datetime_converter",
+    "AbstractPropertySource": ".property_source.abstract_property_source",
+    "CLIPropertySource": ".property_source.cli_property_source",
+    "DictionaryPropertySource": ".property_source.dictionary_property_source",
+    "EnvVarsPropertySource": ".property_source.env_vars_property_source",
+    "PyYAMLPropertySource": ".property_source.pyyaml_property_source",
+    "T": ".protocol.converter",
+    "Converter": ".protocol.converter",
+    "P": ".protocol.property_source",
+    "PropertySource": ".protocol.property_source",
+    "OrderedPropertySource": ".protocol.property_source",
+}
 
 __all__ = (
-    DataclassConverter,
-    IsoFormatDateTimeConverter,
-    AbstractPropertySource,
-    CLIPropertySource,
-    DictionaryPropertySource,
-    EnvVarsPropertySource,
-    PyYAMLPropertySource,
-    T,
-    Converter,
-    P,
-    PropertySource,
-    OrderedPropertySource,
-)
\ No newline at end of file
+    "DataclassConverter",
+    "IsoFormatDateTimeConverter",
+    "AbstractPropertySource",
+    "CLIPropertySource",
+    "DictionaryPropertySource",
+    "EnvVarsPropertySource",
+    "PyYAMLPropertySource",
+    "T",
+    "Converter",
+    "P",
+    "PropertySource",
+    "OrderedPropertySource",
+)
+
+__getattr__, __dir__ = lazy_attributes(globals(), _IMPORTS)
@@ -0,0 +1,30 @@
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_attributes(namespace: Dict[str, Any], imports: Dict[str, str]) -> Tuple[Callable[[str], Any],
+                                                                                  Callable[[], List[str]]]:
+    """ Returns the module level '__getattr__' and '__dir__' for a package whose names ('name -> relative module')
+        are imported on first access. Imported names are stored in the package namespace, so later accesses do not
+        call '__getattr__' again.
+
+        Names of submodules defining an attribute with their own name, like 'default_converter', are imported
+        right away: importing the submodule stores it in the package namespace, where it would shadow the name.
+    """
+    package = namespace["__name__"]
+    for name, module in imports.items():
+        if module == f".{name}":
+            namespace[name] = getattr(import_module(module, package), name)
+
+    def __getattr__(name: str) -> Any:
+        module = imports.get(name)
+        if module is None:
+            raise AttributeError(f"module '{package}' has no attribute '{name}'")
+        value = getattr(import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(imports))
+
+    return __getattr__, __dir__
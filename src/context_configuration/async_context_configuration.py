@@ -0,0 +1,97 @@
+import asyncio
+from typing import Any, List, Sequence, Tuple
+
+from .context_configuration import ContextConfiguration, Resolution
+from .protocol.async_property_source import AsyncOrderedPropertySource
+from .protocol.property_source import P
+
+_MISSING = object()
+
+
+class AsyncContextConfiguration:
+    """ Awaitable access to a ContextConfiguration extended by asynchronous property sources.
+
+        The property sources of the wrapped configuration take precedence; the asynchronous sources are consulted,
+        concurrently, only for properties none of them contains, and the first asynchronous source in order wins.
+        Resolved values are interpolated and cached through the wrapped configuration, so cached properties are
+        returned without awaiting any source and are visible to synchronous 'get_property' calls as well.
+    """
+
+    def __init__(self, configuration: ContextConfiguration,
+                 async_property_sources: Sequence[AsyncOrderedPropertySource] = ()):
+        self._configuration = configuration
+        self._async_property_sources = sorted(async_property_sources, key=lambda source: source.get_order())
+
+    @property
+    def configuration(self) -> ContextConfiguration:
+        return self._configuration
+
+    async def contains_property(self, name: str) -> bool:
+        if self._configuration.contains_property(name):
+            return True
+        results = await asyncio.gather(*(source.contains_property(name) for source in self._async_property_sources))
+        return any(results)
+
+    async def get_property(self, name: str, cls: type[P]) -> P:
+        return (await self.get_resolution(name, cls)).value
+
+    async def get_resolution(self, name: str, cls: type[P]) -> Resolution:
+        configuration = self._configuration
+        resolution = configuration.cached_resolution(name, cls)
+        if resolution is not None:
+            return resolution
+        if configuration.contains_property(name):
+            return configuration.get_resolution(name, cls)
+
+        resolution = await self._resolve_async(name, cls)
+        if resolution is None:
+            raise KeyError(f"Could not find property '{name}'")
+        return resolution
+
+    async def get_properties(self, requests: Sequence[Tuple[str, type]]) -> List[Any]:
+        """ Resolves several '(name, type)' pairs, fetching all properties missing from the wrapped configuration
+            concurrently.
+        """
+        configuration = self._configuration
+        values = [None] * len(requests)
+        synchronous = []
+        asynchronous = []
+        for position, request in enumerate(requests):
+            resolution = configuration.cached_resolution(*request)
+            if resolution is not None:
+                values[position] = resolution.value
+            elif configuration.contains_property(request[0]):
+                synchronous.append(position)
+            else:
+                asynchronous.append(position)
+
+        if synchronous:
+            resolved = configuration.get_properties([requests[position] for position in synchronous])
+            for position, value in zip(synchronous, resolved):
+                values[position] = value
+
+        if asynchronous:
+            resolutions = await asyncio.gather(*(self._resolve_async(*requests[position])
+                                                 for position in asynchronous))
+            missing = [requests[position][0] for position, resolution in zip(asynchronous, resolutions)
+                       if resolution is None]
+            if missing:
+                names = ", ".join(f"'{name}'" for name in missing)
+                raise KeyError(f"Could not find properties {names}")
+            for position, resolution in zip(asynchronous, resolutions):
+                values[position] = resolution.value
+        return values
+
+    async def _resolve_async(self, name: str, cls: type[P]):
+        sources = self._async_property_sources
+        values = await asyncio.gather(*(_fetch(source, name) for source in sources))
+        for source, value in zip(sources, values):
+            if value is not _MISSING:
+                return self._configuration.store_resolution(name, cls, value, source)
+        return None
+
+
+async def _fetch(source: AsyncOrderedPropertySource, name: str) -> Any:
+    if not await source.contains_property(name):
+        return _MISSING
+    return await source.get_property(name, None)
@@ -1,15 +1,72 @@
-from random import random
-from typing import List, Callable, Dict, Tuple, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import List, Callable, Collection, Dict, FrozenSet, Tuple, Any, Optional, Sequence, Set, Union
 from collections import namedtuple
+from dataclasses import is_dataclass
 
+from .converter.converter_registry import ConverterRegistry
+from .converter.dataclass_converter import DataclassConverter, binding_plan, validate_dataclass
 from .converter.default_converter import default_converter, convert
 from .converter.iso_format_datetime_converter import IsoFormatDateTimeConverter
+from .instrumentation import KeyStatistics, LookupEvent, LookupStatistics
+from .interpolation import Placeholder, compile_template, placeholder_names
+from .memoized_scope import MemoizedScope
+from .property_source.compiled_overlay_property_source import CompiledOverlayPropertySource
 from .protocol.property_source import PropertySource, OrderedPropertySource, P
 
 
 
 
 Property = namedtuple('Property', ['argument', 'property_name', 'type'])
+Resolution = namedtuple('Resolution', ['value', 'source'])
+Dependency = namedtuple('Dependency', ['argument', 'bean'])
+_BeanDefinition = namedtuple('_BeanDefinition', ['name', 'func', 'dependencies', 'is_singleton'])
+
+_MISSING = object()
+_AMBIGUOUS = object()
+
+
+def _within_any(names: Collection[str]) -> Callable[[str], bool]:
+    """ Returns a predicate telling whether a name is one of 'names', or a parent or child of one. """
+    names = set(names)
+    parents = {name[:position] for name in names for position, char in enumerate(name) if char == "."}
+
+    def is_within_any(key: str) -> bool:
+        if key in names or key in parents:
+            return True
+        position = key.find(".")
+        while position != -1:
+            if key[:position] in names:
+                return True
+            position = key.find(".", position + 1)
+        return False
+
+    return is_within_any
+
+
+def _is_dynamic(source: OrderedPropertySource) -> bool:
+    # sources which cannot notify changes, like the live environment, are read on every lookup
+    if not hasattr(source, "add_change_listener"):
+        return True
+    return hasattr(source, "is_dynamic") and source.is_dynamic()
+
+
+def _merge(lower: Any, higher: Any) -> Any:
+    if isinstance(lower, dict) and isinstance(higher, dict):
+        merged = dict(lower)
+        for key, value in higher.items():
+            merged[key] = _merge(merged[key], value) if key in merged else value
+        return merged
+    return higher
+
+
+class SchemaValidationError(ValueError):
+    """ Raised on build if the configuration does not match the registered schemas, listing every error. """
+
+    def __init__(self, errors: List[str]):
+        self.errors = errors
+        super().__init__("Configuration does not match its schemas:\n" + "\n".join(f"  {error}" for error in errors))
 
 
 class ContextConfiguration(PropertySource):
@@ -20,25 +77,59 @@ class ContextConfiguration(PropertySource):
     """
 
     _property_sources: List[OrderedPropertySource] = []
-    _converter: Dict[type, Callable] = {}
+    _converter: ConverterRegistry
     _immutable: bool = False
-    _bean_store: Dict[int, Any] = {}
+    _bean_store: Dict[Callable, Any]
+    _beans: Dict[Callable, _BeanDefinition]
+    _bean_names: Dict[str, Any]
+    _bean_graph_checked: bool = False
+    _resolution_cache: Dict[Tuple[str, type], Resolution]
+    _binding_cache: Dict[Tuple[str, type], Any]
+    _schemas: Set[Tuple[str, type]]
+    _interpolations: Dict[str, Any]
+    _dependents: Dict[str, Set[str]]
+    _lock: threading.Lock
+    _dynamic_sources: frozenset
+    _probed_sources: List[OrderedPropertySource]
+    _dynamic_reads: threading.local
+    _statistics: Optional[LookupStatistics] = None
 
-    def __init__(self, property_sources: List[OrderedPropertySource], converter: Dict[type, Callable]):
+    def __init__(self, property_sources: List[OrderedPropertySource], converter: Dict[type, Callable],
+                 dynamic_property_sources: Sequence[OrderedPropertySource] = ()):
         """ Loads the configuration files from disk according to the stage
 
+            Values of the dynamic property sources, and of sources which cannot notify changes, are read on every
+            lookup instead of being cached.
+
             Raises
                 Exception
                     If the environment variable 'RF_STAGE' is set but no configuration file
                     for the stage could be found
         """
-        self._converter = default_converter()
+        self._converter = ConverterRegistry(default_converter())
         datetime_converter = IsoFormatDateTimeConverter()
         self._converter[datetime_converter.for_type()] = datetime_converter.convert
         self._property_sources = property_sources
         self._converter.update(converter)
+        self._resolution_cache = {}
+        self._binding_cache = {}
+        self._schemas = set()
+        self._bean_store = {}
+        self._beans = {}
+        self._bean_names = {}
+        self._interpolations = {}
+        self._dependents = {}
+        self._lock = threading.Lock()
 
         self._make_immutable()
+        self._find_dynamic_sources(dynamic_property_sources)
+        self._check_placeholder_cycles()
+        for source in self._property_sources:
+            if hasattr(source, "add_change_listener"):
+                source.add_change_listener(self._on_source_change)
+
+    def property_sources(self) -> List[OrderedPropertySource]:
+        return list(self._property_sources)
 
     def contains_property(self, name: str) -> bool:
         for source in self._property_sources:
@@ -47,54 +138,598 @@ class ContextConfiguration(PropertySource):
         return False
 
     def get_property(self, name: str, cls: type[P]) -> P:
-        if not self.contains_property(name):
-            raise KeyError(f"Could not find property '{name}'")
+        try:
+            resolution = self._resolution_cache[(name, cls)]
+        except KeyError:
+            return self._resolve(name, cls).value
+        if self._dynamic_sources and self._served_dynamically(name):
+            return self._resolve(name, cls).value
+        return resolution.value
+
+    def get_resolution(self, name: str, cls: type[P]) -> Resolution:
+        """ Returns the converted value of the property together with the property source it was taken from. """
+        resolution = self.cached_resolution(name, cls)
+        if resolution is None:
+            resolution = self._resolve(name, cls)
+        return resolution
+
+    def get_properties(self, requests: Sequence[Tuple[str, type]]) -> List[Any]:
+        """ Resolves several '(name, type)' pairs in a single pass over the property sources.
+
+            Returns the converted values in the order of the requests.
+        """
+        cache = self._resolution_cache
+        values = [None] * len(requests)
+        pending = {}
+        for position, request in enumerate(requests):
+            resolution = self.cached_resolution(*request)
+            if resolution is None:
+                pending[position] = request
+            else:
+                values[position] = resolution.value
 
         for source in self._property_sources:
-            if not source.contains_property(name):
+            if not pending:
+                break
+            for position, (name, cls) in list(pending.items()):
+                if source.contains_property(name):
+                    values[position] = self._resolve_from(cache, source, name, cls).value
+                    del pending[position]
+
+        if pending:
+            names = ", ".join(f"'{name}'" for name, _ in pending.values())
+            raise KeyError(f"Could not find properties {names}")
+        return values
+
+    def cached_resolution(self, name: str, cls: type[P]) -> Optional[Resolution]:
+        """ Returns the cached resolution of the property, or None if it has not been resolved yet or a dynamic
+            property source serves it now.
+        """
+        resolution = self._resolution_cache.get((name, cls))
+        if resolution is not None and self._dynamic_sources and self._served_dynamically(name):
+            return None
+        return resolution
+
+    def store_resolution(self, name: str, cls: type[P], value: Any, source: Any) -> Resolution:
+        """ Interpolates, converts and caches a raw value which was resolved outside of the property sources of
+            this configuration, e.g. by an asynchronous property source, like a value read from its sources.
+        """
+        cache = self._resolution_cache
+        value, dynamic = self._interpolate_read(name, value, False, ())
+        return self._store_resolution(cache, name, cls, value, source, dynamic)
+
+    def bind(self, prefix: str, cls: type[P]) -> P:
+        """ Converts the subtree below 'prefix' into the given dataclass.
+
+            The subtrees of all property sources containing the prefix are merged, with the first source winning
+            for keys defined in several sources. Prefixes validated against a schema are converted like on
+            validation, so they bind the same way after a property source changed. Subtrees taken from dynamic
+            property sources are bound on every call.
+        """
+        key = (prefix, cls)
+        cache = self._binding_cache
+        binding = cache.get(key)
+        if binding is None or (self._dynamic_sources and self._contained_dynamically(prefix)):
+            subtree, dynamic = self._merged_subtree(prefix)
+            if key in self._schemas:
+                binding, errors = validate_dataclass(cls, subtree, self._converter, f"{prefix}.")
+                if errors:
+                    raise SchemaValidationError(errors)
+            else:
+                binding = DataclassConverter(cls).convert(subtree)
+            if not dynamic:
+                cache[key] = binding
+        return binding
+
+    def validate_schemas(self, schemas: Sequence[Tuple[str, type]]) -> None:
+        """ Binds the subtree below each prefix to its dataclass schema, converting values with the converters of
+            this configuration, and raises a SchemaValidationError listing the errors of all schemas.
+
+            The bound dataclasses and the converted values of their fields are stored in the caches, so 'bind' and
+            'get_property' with the field types return them without converting. Once a property source changes,
+            the affected properties are resolved and converted on access again.
+        """
+        errors = []
+        validated = []
+        for prefix, schema in schemas:
+            try:
+                subtree, dynamic = self._merged_subtree(prefix)
+            except KeyError:
+                errors.append(f"'{prefix}': required key not found")
                 continue
+            instance, schema_errors = validate_dataclass(schema, subtree, self._converter, f"{prefix}.")
+            errors.extend(schema_errors)
+            validated.append((prefix, schema, instance, subtree, dynamic))
+        if errors:
+            raise SchemaValidationError(errors)
+
+        for prefix, schema, instance, subtree, dynamic in validated:
+            if dynamic:
+                self._schemas.add((prefix, schema))
+            else:
+                self._store_validated(prefix, schema, instance, subtree)
+
+    def invalidate_cache(self, name: Optional[str] = None) -> None:
+        """ Drops the cached resolutions of the given property, or of all properties if no name is given.
+
+            The resolutions of its parents and children, and of properties referencing it through placeholders,
+            are dropped as well. Property sources supporting change listeners invalidate the properties they report
+            as changed automatically. The caches are replaced rather than modified, so a lookup racing with the
+            invalidation stores its result in the discarded cache.
+        """
+        if name is None:
+            self._resolution_cache = {}
+            self._binding_cache = {}
+            self._interpolations = {}
+            with self._lock:
+                self._dependents = {}
+            return
+        self._invalidate_names((name,))
+
+    def _on_source_change(self, names: Optional[FrozenSet[str]] = None) -> None:
+        if names is None:
+            self.invalidate_cache()
+        elif names:
+            self._invalidate_names(names)
+
+    def _invalidate_names(self, changed_names: Collection[str]) -> None:
+        with self._lock:
+            dependents = [(key, tuple(names)) for key, names in self._dependents.items()]
+        names = set(changed_names)
+        pending = list(names)
+        while pending:
+            is_changed = _within_any(pending)
+            pending = []
+            for key, key_dependents in dependents:
+                if not is_changed(key):
+                    continue
+                for dependent in key_dependents:
+                    if dependent not in names:
+                        names.add(dependent)
+                        pending.append(dependent)
+
+        is_changed = _within_any(names)
+        self._resolution_cache = {key: resolution for key, resolution in list(self._resolution_cache.items())
+                                  if not is_changed(key[0])}
+        self._binding_cache = {key: binding for key, binding in list(self._binding_cache.items())
+                               if not is_changed(key[0])}
+        self._interpolations = {key: value for key, value in list(self._interpolations.items())
+                                if not is_changed(key)}
+
+    def enable_instrumentation(self, hook: Optional[Callable[[LookupEvent], None]] = None) -> LookupStatistics:
+        """ Starts recording per-key cache hits and misses, the source serving each key and the time spent fetching
+            and converting values, optionally passing every lookup to 'hook'.
+
+            The lookup methods are replaced on this instance only, so a configuration without instrumentation
+            runs the plain code path.
+        """
+        statistics = LookupStatistics(hook)
+        record = statistics.record
 
-            value = source.get_property(name, cls)
-            return convert(value, self._converter, cls)
+        def get_property(name: str, cls: type[P]) -> P:
+            resolution = self.cached_resolution(name, cls)
+            if resolution is None:
+                return self._resolve(name, cls).value
+            record(name, cls, True, resolution.source)
+            return resolution.value
+
+        def get_resolution(name: str, cls: type[P]) -> Resolution:
+            resolution = self.cached_resolution(name, cls)
+            if resolution is None:
+                return self._resolve(name, cls)
+            record(name, cls, True, resolution.source)
+            return resolution
+
+        def get_properties(requests: Sequence[Tuple[str, type]]) -> List[Any]:
+            for request in requests:
+                resolution = self.cached_resolution(*request)
+                if resolution is not None:
+                    record(request[0], request[1], True, resolution.source)
+            return ContextConfiguration.get_properties(self, requests)
+
+        def resolve_from(cache: Dict[Tuple[str, type], Resolution], source: OrderedPropertySource, name: str,
+                         cls: type[P]) -> Resolution:
+            start = perf_counter()
+            value, dynamic = self._interpolate_read(name, source.get_property(name, None),
+                                                    id(source) in self._dynamic_sources, ())
+            fetched = perf_counter()
+            resolution = self._store_resolution(cache, name, cls, value, source, dynamic)
+            record(name, cls, False, resolution.source, fetched - start, perf_counter() - fetched)
+            return resolution
+
+        self.get_property = get_property
+        self.get_resolution = get_resolution
+        self.get_properties = get_properties
+        self._resolve_from = resolve_from
+        self._statistics = statistics
+        return statistics
+
+    def disable_instrumentation(self) -> None:
+        for name in ("get_property", "get_resolution", "get_properties", "_resolve_from"):
+            self.__dict__.pop(name, None)
+        self._statistics = None
+
+    def stats(self) -> Dict[str, KeyStatistics]:
+        """ Returns a snapshot of the per-key lookup statistics, empty if instrumentation is disabled. """
+        if self._statistics is None:
+            return {}
+        return self._statistics.snapshot()
+
+    def _resolve(self, name: str, cls: type[P]) -> Resolution:
+        cache = self._resolution_cache
+        for source in self._property_sources:
+            if source.contains_property(name):
+                return self._resolve_from(cache, source, name, cls)
         raise KeyError(f"Could not find property '{name}'")
 
+    def _resolve_from(self, cache: Dict[Tuple[str, type], Resolution], source: OrderedPropertySource, name: str,
+                      cls: type[P]) -> Resolution:
+        value, dynamic = self._interpolate_read(name, source.get_property(name, None),
+                                                id(source) in self._dynamic_sources, ())
+        return self._store_resolution(cache, name, cls, value, source, dynamic)
+
+    def _store_resolution(self, cache: Dict[Tuple[str, type], Resolution], name: str, cls: type[P], value: Any,
+                          source: Any, dynamic: bool = False) -> Resolution:
+        if type(value) is not cls:
+            value = convert(value, self._converter, cls)
+        if hasattr(source, "source_of"):
+            source = source.source_of(name)
+        resolution = Resolution(value, source)
+        if not dynamic:
+            cache[(name, cls)] = resolution
+        return resolution
+
+    def _find_dynamic_sources(self, dynamic_property_sources: Sequence[OrderedPropertySource]) -> None:
+        dynamic_sources = {id(source) for source in dynamic_property_sources}
+        dynamic_sources.update(id(source) for source in self._property_sources if _is_dynamic(source))
+        self._dynamic_sources = frozenset(dynamic_sources)
+        self._dynamic_reads = threading.local()
+        # a cached value is served by a dynamic source if the first source containing it is dynamic, sources
+        # after the last dynamic one need not be probed
+        last = max((position for position, source in enumerate(self._property_sources)
+                    if id(source) in dynamic_sources), default=-1)
+        self._probed_sources = self._property_sources[:last + 1]
+
+    def _served_dynamically(self, name: str) -> bool:
+        for source in self._probed_sources:
+            if source.contains_property(name):
+                return id(source) in self._dynamic_sources
+        return False
+
+    def _contained_dynamically(self, name: str) -> bool:
+        return any(source.contains_property(name) for source in self._probed_sources
+                   if id(source) in self._dynamic_sources)
+
+    def _store_validated(self, prefix: str, schema: type, instance: Any, subtree: Dict[str, Any]) -> None:
+        self._schemas.add((prefix, schema))
+        self._binding_cache[(prefix, schema)] = instance
+        self._resolution_cache[(prefix, schema)] = Resolution(instance, self._source_containing(prefix))
+        for binding in binding_plan(schema):
+            if binding.name not in subtree:
+                continue
+            name = f"{prefix}.{binding.name}"
+            value = getattr(instance, binding.name)
+            if binding.nested_dataclass is not None and value is not None:
+                self._store_validated(name, binding.nested_dataclass, value, subtree[binding.name])
+            elif binding.expected_type is not None and isinstance(value, binding.expected_type):
+                self._resolution_cache[(name, binding.expected_type)] = Resolution(value, self._source_containing(name))
+
+    def _source_containing(self, name: str) -> Any:
+        for source in self._property_sources:
+            if source.contains_property(name):
+                return source.source_of(name) if hasattr(source, "source_of") else source
+        return None
+
+    def _merged_subtree(self, prefix: str) -> Tuple[Any, bool]:
+        """ Returns the merged subtree below 'prefix' and whether it depends on a dynamic property source. """
+        subtree = _MISSING
+        dynamic = False
+        for source in reversed(self._property_sources):
+            if source.contains_property(prefix):
+                subtree = _merge(subtree, source.get_property(prefix, None))
+                dynamic = dynamic or id(source) in self._dynamic_sources
+        if subtree is _MISSING:
+            raise KeyError(f"Could not find property '{prefix}'")
+        return self._interpolate_read(prefix, subtree, dynamic, ())
+
+    def _raw_property(self, name: str) -> Tuple[Any, bool]:
+        """ Returns the raw value of the property, or _MISSING, and whether a dynamic property source could
+            change it, i.e. one was probed before the value was found.
+        """
+        dynamic = False
+        for source in self._property_sources:
+            dynamic = dynamic or id(source) in self._dynamic_sources
+            if source.contains_property(name):
+                return source.get_property(name, None), dynamic
+        return _MISSING, dynamic
+
+    def _interpolate_read(self, name: str, value: Any, dynamic: bool, resolving: Tuple[str, ...]) -> Tuple[Any, bool]:
+        """ Interpolates a value read from the property sources and returns it together with whether it, or any
+            placeholder it references, depends on a dynamic property source. Such values are not cached.
+        """
+        if not self._dynamic_sources:
+            return self._interpolate(name, value, (*resolving, name)), False
+        reads = self._dynamic_reads
+        outer = getattr(reads, "dynamic", False)
+        reads.dynamic = dynamic
+        try:
+            value = self._interpolate(name, value, (*resolving, name))
+            return value, reads.dynamic
+        finally:
+            reads.dynamic = outer or reads.dynamic
+
+    def _interpolate(self, name: str, value: Any, resolving: Tuple[str, ...]) -> Any:
+        """ Replaces the '${name:default}' placeholders in a value, recursing into dictionaries and lists, and
+            unescapes '$${' to '${'.
+
+            A value consisting of a single placeholder takes the value of the referenced property as is, otherwise
+            the referenced values are inserted as strings.
+        """
+        if isinstance(value, str):
+            template = compile_template(value) if "${" in value else None
+            if template is None:
+                return value
+            if len(template) == 1 and isinstance(template[0], Placeholder):
+                return self._placeholder_value(name, template[0], resolving)
+            return "".join(segment if isinstance(segment, str)
+                           else str(self._placeholder_value(name, segment, resolving)) for segment in template)
+        if isinstance(value, dict):
+            interpolated = {key: self._interpolate(name, child, resolving) for key, child in value.items()}
+            return value if all(interpolated[key] is child for key, child in value.items()) else interpolated
+        if isinstance(value, list):
+            interpolated = [self._interpolate(name, child, resolving) for child in value]
+            return value if all(new is old for new, old in zip(interpolated, value)) else interpolated
+        return value
+
+    def _placeholder_value(self, dependent: str, placeholder: Placeholder, resolving: Tuple[str, ...]) -> Any:
+        name = placeholder.name
+        with self._lock:
+            self._dependents.setdefault(name, set()).add(dependent)
+        interpolations = self._interpolations
+        if name in interpolations:
+            return interpolations[name]
+        if name in resolving:
+            raise ValueError(f"Circular placeholder reference: {' -> '.join((*resolving, name))}")
+
+        raw_value, dynamic = self._raw_property(name)
+        if raw_value is _MISSING:
+            if dynamic:
+                self._dynamic_reads.dynamic = True
+            if placeholder.default is None:
+                raise KeyError(f"Could not resolve placeholder '${{{name}}}' in property '{dependent}'")
+            return placeholder.default
+        value, dynamic = self._interpolate_read(name, raw_value, dynamic, resolving)
+        if not dynamic:
+            interpolations[name] = value
+        return value
+
+    def _check_placeholder_cycles(self) -> None:
+        references = {}
+        for source in self._property_sources:
+            if hasattr(source, "is_loaded") and not source.is_loaded():
+                continue
+            index = source.property_index() if hasattr(source, "property_index") else None
+            for key, value in (index or {}).items():
+                if key in references or not isinstance(value, str) or "${" not in value:
+                    continue
+                template = compile_template(value)
+                if template is not None:
+                    references[key] = list(placeholder_names(template))
+
+        visited = set()
+        for start in references:
+            if start in visited:
+                continue
+            path = [start]
+            iterators = [iter(references[start])]
+            on_path = {start}
+            while iterators:
+                name = next(iterators[-1], None)
+                if name is None:
+                    finished = path.pop()
+                    on_path.discard(finished)
+                    visited.add(finished)
+                    iterators.pop()
+                    continue
+                if name in on_path:
+                    cycle = path[path.index(name):] + [name]
+                    raise ValueError(f"Circular placeholder reference: {' -> '.join(cycle)}")
+                if name in visited or name not in references:
+                    continue
+                path.append(name)
+                on_path.add(name)
+                iterators.append(iter(references[name]))
 
     def _make_immutable(self) -> None:
-        sorted(self._property_sources, key=lambda source: source.get_order)
+        self._property_sources = sorted(self._property_sources, key=lambda source: source.get_order())
         self._immutable = True
 
-    def properties(self, properties: List[Property], is_singleton: bool = True) -> Any:
+    def properties(self, properties: List[Property], is_singleton: bool = True,
+                   scope: Optional[MemoizedScope] = None, dependencies: Sequence[Dependency] = ()) -> Any:
+        """ Decorates a bean factory, passing the resolved properties as keyword arguments.
+
+            Singletons are created once per configuration. Other beans are created on every call, unless a
+            MemoizedScope is given, which reuses the instance created from the same property values. Dependencies
+            name another bean of this configuration, either the decorated function or its name, which is passed
+            as the given argument.
+        """
+        if is_singleton and scope is not None:
+            raise ValueError("A scope can only be used for beans which are not singletons")
+
+        arguments = [prop.argument for prop in properties] + [dependency.argument for dependency in dependencies]
+        requests = [(prop.property_name, prop.type) for prop in properties]
 
         def decorator(func) -> Any:
+            lock = threading.Lock()
+
+            def resolve():
+                values = self.get_properties(requests)
+                if dependencies:
+                    if not self._bean_graph_checked:
+                        self._bean_levels()
+                    values += [self._bean(dependency.bean)() for dependency in dependencies]
+                return values
+
+            def create(values):
+                return func(**dict(zip(arguments, values)))
+
             def wrapper():
-                if is_singleton and id(func) in self._bean_store:
-                    return self._bean_store[id(func)]
-                kwargs = {}
-                for prop in properties:
-                    kwargs[prop.argument] = self.get_property(prop.property_name, prop.type)
-                    kwargs[prop.argument] = f"{kwargs[prop.argument]} {random()}"
-                result = func(**kwargs)
-                self._bean_store[id(func)] = result
-                return result
+                if not is_singleton:
+                    values = resolve()
+                    if scope is None:
+                        return create(values)
+                    return scope.get((func, *values), lambda: create(values))
+                bean_store = self._bean_store
+                if func in bean_store:
+                    return bean_store[func]
+                with lock:
+                    if func not in bean_store:
+                        bean_store[func] = create(resolve())
+                    return bean_store[func]
 
+            self._register_bean(wrapper, _BeanDefinition(func.__name__, func, tuple(dependencies), is_singleton))
             return wrapper
 
         return decorator
 
+    def warm_up(self, max_workers: Optional[int] = None) -> Dict[str, float]:
+        """ Creates all singleton beans which were not created yet, concurrently on a thread pool. Beans are created
+            level by level, so the dependencies of a bean are created before it.
+
+            Returns the seconds each created bean took to construct, by bean name. Raises a ValueError if the bean
+            dependencies contain a cycle.
+        """
+        construction_times = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for level in self._bean_levels():
+                pending = [bean for bean in level
+                           if self._beans[bean].is_singleton and self._beans[bean].func not in self._bean_store]
+                construction_times.update(executor.map(self._construct_bean, pending))
+        return construction_times
+
+    def _register_bean(self, wrapper: Callable, definition: _BeanDefinition) -> None:
+        self._beans[wrapper] = definition
+        self._bean_names[definition.name] = _AMBIGUOUS if definition.name in self._bean_names else wrapper
+        self._bean_graph_checked = False
+
+    def _bean(self, bean: Union[str, Callable]) -> Callable:
+        if not isinstance(bean, str):
+            return bean
+        wrapper = self._bean_names.get(bean)
+        if wrapper is None:
+            raise KeyError(f"Could not find bean '{bean}'")
+        if wrapper is _AMBIGUOUS:
+            raise ValueError(f"Several beans are named '{bean}', depend on the bean itself instead of its name")
+        return wrapper
+
+    def _bean_levels(self) -> List[List[Callable]]:
+        """ Sorts the beans topologically into levels whose beans depend on beans of earlier levels only. """
+        remaining = {}
+        for wrapper, definition in self._beans.items():
+            remaining[wrapper] = {self._bean(dependency.bean) for dependency in definition.dependencies} \
+                & self._beans.keys()
+
+        levels = []
+        created = set()
+        while remaining:
+            level = [wrapper for wrapper, dependencies in remaining.items() if dependencies <= created]
+            if not level:
+                names = ", ".join(sorted(self._beans[wrapper].name for wrapper in remaining))
+                raise ValueError(f"Circular bean dependencies between {names}")
+            for wrapper in level:
+                del remaining[wrapper]
+            created.update(level)
+            levels.append(level)
+        self._bean_graph_checked = True
+        return levels
+
+    def _construct_bean(self, wrapper: Callable) -> Tuple[str, float]:
+        start = perf_counter()
+        wrapper()
+        return self._beans[wrapper].name, perf_counter() - start
+
 
 class ContextConfigurationBuilder:
-    _property_sources: List[OrderedPropertySource] = []
-    _converter: Dict[type, Callable] = {}
-    _order: 0
+    _property_sources: List[OrderedPropertySource]
+    _dynamic_property_sources: Set[int]
+    _converter: Dict[type, Callable]
+    _schemas: List[Tuple[str, type]]
+    _compile_overlay: bool = False
 
-    def with_property_source(self, property_source: OrderedPropertySource):
+    def __init__(self):
+        self._property_sources = []
+        self._dynamic_property_sources = set()
+        self._converter = {}
+        self._schemas = []
+
+    def with_property_source(self, property_source: OrderedPropertySource, dynamic: bool = False):
+        """ Adds a property source. Dynamic sources, e.g. the live environment, are never compiled into an
+            overlay and their values are read on every lookup instead of being cached.
+        """
         self._property_sources.append(property_source)
+        if dynamic:
+            self._dynamic_property_sources.add(id(property_source))
+        return self
+
+    def with_compiled_overlay(self, enabled: bool = True):
+        """ Compiles consecutive static property sources into a single CompiledOverlayPropertySource on build,
+            so a lookup probes one index instead of every source. Dynamic sources, lazy sources which are
+            not loaded yet and sources which cannot enumerate their properties stay separate layers at their
+            position in the order.
+        """
+        self._compile_overlay = enabled
+        return self
+
+    def with_schema(self, prefix: str, schema: type):
+        """ Validates the properties below 'prefix' against the dataclass 'schema' on build, see
+            ContextConfiguration.validate_schemas.
+        """
+        if not is_dataclass(schema):
+            raise ValueError(f"Expecting class '{schema}' of type dataclass.")
+        self._schemas.append((prefix, schema))
         return self
 
     def with_converter(self, converter: Tuple[type, Callable]):
         _type, _callable = converter
-        self._converter[_type] = callable
+        self._converter[_type] = _callable
         return self
 
     def build(self) -> ContextConfiguration:
-        return ContextConfiguration(self._property_sources, self._converter)
+        property_sources = sorted(self._property_sources, key=lambda source: source.get_order())
+        if self._compile_overlay:
+            property_sources = self._compile_property_sources(property_sources)
+        dynamic_property_sources = [source for source in self._property_sources
+                                    if id(source) in self._dynamic_property_sources]
+        configuration = ContextConfiguration(property_sources, self._converter, dynamic_property_sources)
+        if self._schemas:
+            configuration.validate_schemas(self._schemas)
+        return configuration
+
+    def _compile_property_sources(self, property_sources: List[OrderedPropertySource]) -> List[OrderedPropertySource]:
+        compiled = []
+        group = []
+        for source in property_sources:
+            if _is_compilable(source) and id(source) not in self._dynamic_property_sources:
+                group.append(source)
+                continue
+            compiled.extend(_compile_group(group))
+            group = []
+            compiled.append(source)
+        compiled.extend(_compile_group(group))
+        return compiled
+
+
+def _is_compilable(source: OrderedPropertySource) -> bool:
+    # asking a lazy source for its index would load it, sources which are not loaded yet stay separate layers
+    if hasattr(source, "is_loaded") and not source.is_loaded():
+        return False
+    # sources whose properties expire, like a stale HTTP document, opt out of being copied into an overlay
+    if hasattr(source, "is_compilable") and not source.is_compilable():
+        return False
+    return hasattr(source, "property_index") and source.property_index() is not None
+
+
+def _compile_group(property_sources: List[OrderedPropertySource]) -> List[OrderedPropertySource]:
+    if len(property_sources) < 2:
+        return property_sources
+    return [CompiledOverlayPropertySource(property_sources)]
@@ -1,3 +1,50 @@
-from .dataclass_converter import DataclassConverter
-from .default_converter import *
-from .iso_format_datetime_converter import IsoFormatDateTimeConverter
\ No newline at end of file
+from typing import TYPE_CHECKING
+
+from .._lazy_imports import lazy_attributes
+
+if TYPE_CHECKING:
+    from .converter_registry import ConverterRegistry
+    from .dataclass_converter import DataclassConverter
+    from .default_converter import convert_string, convert_int, convert_float, convert_bool, default_converter, \
+        resolve_converter, convert
+    from .iso_format_datetime_converter import IsoFormatDateTimeConverter
+    from .numeric_array_converter import IntArray, FloatArray, convert_int_array, convert_float_array, \
+        numeric_array_converter
+
+_IMPORTS = {
+    "ConverterRegistry": ".converter_registry",
+    "DataclassConverter": ".dataclass_converter",
+    "convert_string": ".default_converter",
+    "convert_int": ".default_converter",
+    "convert_float": ".default_converter",
+    "convert_bool": ".default_converter",
+    "default_converter": ".default_converter",
+    "resolve_converter": ".default_converter",
+    "convert": ".default_converter",
+    "IsoFormatDateTimeConverter": ".iso_format_datetime_converter",
+    "IntArray": ".numeric_array_converter",
+    "FloatArray": ".numeric_array_converter",
+    "convert_int_array": ".numeric_array_converter",
+    "convert_float_array": ".numeric_array_converter",
+    "numeric_array_converter": ".numeric_array_converter",
+}
+
+__all__ = (
+    "ConverterRegistry",
+    "DataclassConverter",
+    "convert_string",
+    "convert_int",
+    "convert_float",
+    "convert_bool",
+    "default_converter",
+    "resolve_converter",
+    "convert",
+    "IsoFormatDateTimeConverter",
+    "IntArray",
+    "FloatArray",
+    "convert_int_array",
+    "convert_float_array",
+    "numeric_array_converter",
+)
+
+__getattr__, __dir__ = lazy_attributes(globals(), _IMPORTS)
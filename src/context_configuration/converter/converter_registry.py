@@ -0,0 +1,46 @@
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional
+
+from .default_converter import resolve_converter
+
+
+class ConverterRegistry(Mapping[type, Callable]):
+    """ Maps target types to converter callables.
+
+        Lookups hit the registered types directly; types without an exact registration (subclasses, 'Optional[X]',
+        generic aliases) are resolved once and memoized until the next registration.
+    """
+
+    def __init__(self, converters: Optional[Mapping[type, Callable]] = None):
+        self._converters: Dict[Any, Callable] = dict(converters or {})
+        self._resolved: Dict[Any, Optional[Callable]] = dict(self._converters)
+
+    def __getitem__(self, clazz: Any) -> Callable:
+        return self._converters[clazz]
+
+    def __setitem__(self, clazz: Any, converter_callable: Callable) -> None:
+        self.register(clazz, converter_callable)
+
+    def __iter__(self) -> Iterator[type]:
+        return iter(self._converters)
+
+    def __len__(self) -> int:
+        return len(self._converters)
+
+    def register(self, clazz: Any, converter_callable: Callable) -> None:
+        self._converters[clazz] = converter_callable
+        self._resolved = dict(self._converters)
+
+    def update(self, converters: Mapping[type, Callable]) -> None:
+        self._converters.update(converters)
+        self._resolved = dict(self._converters)
+
+    def get(self, clazz: Any, default: Optional[Callable] = None) -> Optional[Callable]:
+        """ Returns the converter for the given type, including resolved subclass, optional and generic matches. """
+        try:
+            converter_callable = self._resolved[clazz]
+        except KeyError:
+            converter_callable = resolve_converter(self._converters, clazz)
+            self._resolved[clazz] = converter_callable
+        except TypeError:
+            converter_callable = resolve_converter(self._converters, clazz)
+        return default if converter_callable is None else converter_callable
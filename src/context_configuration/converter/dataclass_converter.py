@@ -1,15 +1,150 @@
-from dataclasses import dataclass, is_dataclass
+from collections import namedtuple
+from dataclasses import dataclass, is_dataclass, fields, MISSING
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
+from .default_converter import convert
 from ..protocol.converter import Converter, T
-import inspect
 import typing
 
+try:
+    from types import UnionType
+    _UNION_TYPES = (typing.Union, UnionType)
+except ImportError:  # Python < 3.10
+    _UNION_TYPES = (typing.Union,)
+
+_NONE_TYPE = type(None)
+_MISSING = object()
+
+FieldBinding = namedtuple('FieldBinding', ['name', 'has_default', 'optional', 'expected_type', 'nested_dataclass'])
+
+_binding_plans: Dict[type, Tuple[FieldBinding, ...]] = {}
+
+
+def binding_plan(cls: type) -> Tuple[FieldBinding, ...]:
+    """ Returns the compiled binding plan of a dataclass, compiling it on first use. """
+    plan = _binding_plans.get(cls)
+    if plan is None:
+        plan = _compile_binding_plan(cls)
+        _binding_plans[cls] = plan
+        for binding in plan:
+            if binding.nested_dataclass is not None:
+                binding_plan(binding.nested_dataclass)
+    return plan
+
+
+def _compile_binding_plan(cls: type) -> Tuple[FieldBinding, ...]:
+    try:
+        type_hints = typing.get_type_hints(cls)
+    except Exception:
+        type_hints = {}
+
+    plan = []
+    for field in fields(cls):
+        if not field.init:
+            continue
+        annotation = type_hints.get(field.name, field.type)
+        has_default = field.default is not MISSING or field.default_factory is not MISSING
+
+        optional = False
+        if typing.get_origin(annotation) in _UNION_TYPES:
+            arguments = [argument for argument in typing.get_args(annotation) if argument is not _NONE_TYPE]
+            optional = len(arguments) < len(typing.get_args(annotation))
+            annotation = arguments[0] if len(arguments) == 1 else None
+
+        expected_type = annotation if isinstance(annotation, type) else None
+        nested_dataclass = expected_type if expected_type is not None and is_dataclass(expected_type) else None
+        plan.append(FieldBinding(field.name, has_default, optional, expected_type, nested_dataclass))
+    return tuple(plan)
+
+
+def _bind(cls: type, plan: Tuple[FieldBinding, ...], properties: Dict[str, Any]) -> Any:
+    kw_arguments = {}
+    for name, has_default, optional, expected_type, nested_dataclass in plan:
+        value = properties.get(name, _MISSING)
+        if value is _MISSING:
+            if has_default:
+                continue
+            if optional:
+                kw_arguments[name] = None
+                continue
+            raise ValueError(f"Required key '{name}' not found in configuration parameters.")
+
+        if nested_dataclass is not None and isinstance(value, dict):
+            value = _bind(nested_dataclass, binding_plan(nested_dataclass), value)
+        elif expected_type is not None and type(value) is not expected_type and not (optional and value is None):
+            raise ValueError(f"Required key '{name}' is of wrong type "
+                             f"(expected: '{expected_type}', "
+                             f"given: '{type(value)}'.")
+        kw_arguments[name] = value
+    try:
+        return cls(**kw_arguments)
+    except ValueError as e:
+        raise ValueError(f"Could not convert '{properties}' to dataclass of type '{cls}'.") from e
+
+
+def validate_dataclass(cls: type, properties: Any, converter: Mapping[type, Callable],
+                       path: str = "") -> Tuple[Optional[Any], List[str]]:
+    """ Binds the properties to the dataclass like DataclassConverter, but converts values of other types with the
+        given converters and collects all errors instead of stopping at the first one.
+
+        Returns the dataclass instance, or None if there were errors, and the error messages naming the dotted path
+        of each field, prefixed with 'path'.
+    """
+    errors = []
+    instance = _validate(cls, binding_plan(cls), properties, converter, path, errors)
+    return (None if errors else instance), errors
+
+
+def _validate(cls: type, plan: Tuple[FieldBinding, ...], properties: Any, converter: Mapping[type, Callable],
+              path: str, errors: List[str]) -> Any:
+    if not isinstance(properties, dict):
+        errors.append(f"'{path.rstrip('.')}': expected a mapping for '{cls.__name__}', "
+                      f"given: '{type(properties).__name__}'")
+        return None
+
+    error_count = len(errors)
+    kw_arguments = {}
+    for name, has_default, optional, expected_type, nested_dataclass in plan:
+        value = properties.get(name, _MISSING)
+        if value is _MISSING or (value is None and optional):
+            if value is _MISSING and has_default:
+                continue
+            if optional:
+                kw_arguments[name] = None
+                continue
+            errors.append(f"'{path}{name}': required key not found")
+            continue
+        if value is None and expected_type is not None:
+            errors.append(f"'{path}{name}': required key is null")
+            continue
+
+        if nested_dataclass is not None:
+            value = _validate(nested_dataclass, binding_plan(nested_dataclass), value, converter, f"{path}{name}.",
+                              errors)
+        elif expected_type is not None and type(value) is not expected_type:
+            try:
+                value = convert(value, converter, expected_type)
+            except KeyError:
+                errors.append(f"'{path}{name}': cannot convert {value!r} to '{expected_type.__name__}'")
+                continue
+        kw_arguments[name] = value
+
+    if len(errors) > error_count:
+        return None
+    try:
+        return cls(**kw_arguments)
+    except (TypeError, ValueError) as e:
+        errors.append(f"'{path.rstrip('.')}': {e}")
+        return None
+
+
 class DataclassConverter(Converter[T: dataclass]):
 
     def __init__(self, cls: T):
         if not is_dataclass(cls):
             raise ValueError(f"Expecting class '{cls}' of type dataclass.")
         self._cls = cls
+        self._plan = binding_plan(cls)
 
     def for_type(self) -> dataclass:
         return self._cls
@@ -17,29 +152,4 @@ class DataclassConverter(Converter[T: dataclass]):
     def convert(self, properties) -> dataclass:
         if not isinstance(properties, dict):
             raise ValueError("Given value must be a dict, cannot convert to a dataclass.")
-
-        sig = inspect.signature(self._cls)
-
-        kw_arguments = {}
-        for param in sig.parameters.values():
-            kw_arguments[param.name] = None
-            if param.name not in properties:
-                if param.default != inspect.Parameter.empty:
-                    properties[param.name] = param.default
-                    continue
-                if param.annotation == typing.Optional[str]:
-                    continue
-                if param.annotation == typing.Optional[int]:
-                    continue
-                if param.annotation == typing.Optional[float]:
-                    continue
-                raise ValueError(f"Required key '{param.name}' not found in configuration parameters.")
-            if type(properties[param.name]) != param.annotation:
-                raise ValueError(f"Required key '{param.name}' is of wrong type "
-                                 f"(expected: '{param.annotation}', "
-                                 f"given: '{type(properties[param.name])}'.")
-            kw_arguments[param.name] = properties[param.name]
-        try:
-            return self._cls(**kw_arguments)
-        except ValueError as e:
-            raise ValueError(f"Could not convert '{properties}' to dataclass of type '{self._cls}'.") from e
+        return _bind(self._cls, self._plan, properties)
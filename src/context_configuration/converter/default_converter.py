@@ -1,7 +1,17 @@
-from typing import Any, Callable, Dict
+import typing
+from typing import Any, Callable, Dict, Mapping, Optional
 
+from .numeric_array_converter import numeric_array_converter
 from ..protocol.property_source import P
 
+try:
+    from types import UnionType
+    _UNION_TYPES = (typing.Union, UnionType)
+except ImportError:  # Python < 3.10
+    _UNION_TYPES = (typing.Union,)
+
+_NONE_TYPE = type(None)
+
 
 def convert_string(value: Any) -> str:
     return str(value)
@@ -15,18 +25,83 @@ def convert_float(value: Any) -> float:
     return float(value)
 
 
+def convert_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        normalized = value.strip().lower()
+        if normalized in ("true", "yes", "on", "1"):
+            return True
+        if normalized in ("false", "no", "off", "0"):
+            return False
+        raise ValueError(f"Cannot interpret '{value}' as a boolean")
+    return bool(value)
+
+
 def default_converter() -> Dict[type, Callable]:
     return {
         str: convert_string,
         int: convert_int,
         float: convert_float,
+        bool: convert_bool,
+        **numeric_array_converter(),
     }
 
-def convert(value: Any, converter_list: Dict[type, Callable], clazz: type[P]) -> P:
-    for cls, converter_callable in converter_list.items():
-        if cls == clazz:
-            try:
-                return converter_callable(value)
-            except Exception as e:
-                raise KeyError(f'Error while trying to convert {value} to {clazz.__name__}') from e
-    raise KeyError(f"Could not convert property '{value}'to {clazz.__name__}, no converter found!")
\ No newline at end of file
+
+def resolve_converter(converter_list: Mapping[type, Callable], clazz: Any) -> Optional[Callable]:
+    """ Finds the converter for the given type.
+
+        Exact matches win. 'Optional[X]' resolves to the converter of 'X' passing 'None' through, generic aliases
+        such as 'list[int]' fall back to the converter of their origin, and classes fall back to the converter of
+        the closest base class in their MRO, whose result is passed to the class if it is not an instance yet.
+    """
+    converter_callable = converter_list.get(clazz)
+    if converter_callable is not None:
+        return converter_callable
+
+    origin = typing.get_origin(clazz)
+    if origin in _UNION_TYPES:
+        arguments = [argument for argument in typing.get_args(clazz) if argument is not _NONE_TYPE]
+        if len(arguments) != 1:
+            return None
+        inner_converter = resolve_converter(converter_list, arguments[0])
+        if inner_converter is None:
+            return None
+        return lambda value: None if value is None else inner_converter(value)
+
+    if origin is not None:
+        return resolve_converter(converter_list, origin)
+
+    if isinstance(clazz, type):
+        for base in clazz.__mro__[1:]:
+            converter_callable = converter_list.get(base)
+            if converter_callable is not None:
+                return _subclass_converter(converter_callable, clazz)
+    return None
+
+
+def _subclass_converter(base_converter: Callable, clazz: type) -> Callable:
+    """ Converts with the converter of a base class and passes results which are not instances of 'clazz' to its
+        constructor, e.g. the int converted for 'class Port(int)' or an 'IntEnum'.
+    """
+    def convert_subclass(value: Any) -> Any:
+        result = base_converter(value)
+        if isinstance(result, clazz):
+            return result
+        return clazz(result)
+
+    return convert_subclass
+
+
+def convert(value: Any, converter_list: Mapping[type, Callable], clazz: type[P]) -> P:
+    converter_callable = converter_list.get(clazz)
+    if converter_callable is None:
+        converter_callable = resolve_converter(converter_list, clazz)
+    if converter_callable is None:
+        raise KeyError(f"Could not convert property '{value}' to {_type_name(clazz)}, no converter found!")
+    try:
+        return converter_callable(value)
+    except Exception as e:
+        raise KeyError(f'Error while trying to convert {value} to {_type_name(clazz)}') from e
+
+
+def _type_name(clazz: Any) -> str:
+    return getattr(clazz, "__name__", str(clazz))
@@ -0,0 +1,75 @@
+from array import array
+from typing import Any, Callable, Dict, NewType
+
+INT_TYPECODE = 'q'
+FLOAT_TYPECODE = 'd'
+
+# target types requesting compact arrays, 'list[int]' and 'list[float]' keep their own converters
+IntArray = NewType("IntArray", array)
+FloatArray = NewType("FloatArray", array)
+
+
+def _elements(value: Any) -> Any:
+    if isinstance(value, str):
+        return [element.strip() for element in value.split(",") if element.strip()]
+    return value
+
+
+def _integral(element: Any) -> int:
+    if isinstance(element, float) and not element.is_integer():
+        raise ValueError(f"Cannot convert non-integral value {element!r} to int")
+    return int(element)
+
+
+def convert_int_array(value: Any) -> array:
+    """ Converts a list of numbers, or a comma separated string, into an array of 64 bit integers. Lists of ints are
+        copied in a single call, other elements are converted one by one like scalar int properties. Floats with a
+        fractional part raise a ValueError instead of being truncated.
+    """
+    value = _elements(value)
+    try:
+        return array(INT_TYPECODE, value)
+    except TypeError:
+        return array(INT_TYPECODE, map(_integral, value))
+
+
+def convert_float_array(value: Any) -> array:
+    """ Converts a list of numbers, or a comma separated string, into an array of doubles. """
+    value = _elements(value)
+    try:
+        return array(FLOAT_TYPECODE, value)
+    except TypeError:
+        return array(FLOAT_TYPECODE, map(float, value))
+
+
+def _numpy_converter(numpy: Any, dtype: Any, element_type: type,
+                     convert_element: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def convert_numpy_array(value: Any) -> Any:
+        value = _elements(value)
+        if any(type(element) is not element_type for element in value):
+            value = [convert_element(element) for element in value]
+        return numpy.asarray(value, dtype=dtype)
+
+    return convert_numpy_array
+
+
+def numeric_array_converter(prefer_numpy: bool = False) -> Dict[Any, Callable]:
+    """ Returns converters for 'IntArray' and 'FloatArray' producing compact 'array.array' values, or NumPy arrays
+        if 'prefer_numpy' is set and NumPy is installed.
+
+        The converters are registered by default with 'array.array'; the NumPy variant can be passed as converters
+        to the ContextConfiguration.
+    """
+    int_converter, float_converter = convert_int_array, convert_float_array
+    if prefer_numpy:
+        try:
+            import numpy
+        except ImportError:
+            pass
+        else:
+            int_converter = _numpy_converter(numpy, numpy.int64, int, _integral)
+            float_converter = _numpy_converter(numpy, numpy.float64, float, float)
+    return {
+        IntArray: int_converter,
+        FloatArray: float_converter,
+    }
@@ -1,34 +1,67 @@
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Any
+from typing import List, Optional, Dict, Tuple
 
-from property_source.pyyaml_property_source import PyYAMLPropertySource
-from protocol.property_source import PropertySource
+from .parsed_config_cache import ParsedConfigCache
+from .property_source.pyyaml_property_source import PyYAMLPropertySource
+from .protocol.property_source import PropertySource
 
 
 class DefaultPropertySourcesLoader:
-    property_sources: List[PropertySource] = []
+    """ Loads one 'application-{profile}.yaml' property source per profile.
+
+        Files are looked up relative to the working directory first and then in 'config_directory' (the
+        'profiles' folder next to this module by default). They are read and parsed concurrently on a thread pool,
+        the property sources keep the order of the given profiles. If profiles are missing, a single
+        FileNotFoundError names all of them. 'load_times' maps every file to the seconds it took to load.
+    """
+
     stage_config_file_pattern = "application-{profile}.yaml"
 
-    def __init__(self, profiles: List[str], config_directory: str = None):
-        for profile in profiles:
-            self._add_property_source(profile)
+    def __init__(self, profiles: List[str], config_directory: str = None, cache: Optional[ParsedConfigCache] = None,
+                 max_workers: Optional[int] = None, lazy: bool = False):
         if config_directory is not None:
             self.config_directory = config_directory
-        self.config_directory = os.path.abspath(os.path.join(os.path.dirname(__file__), "profiles"))
+        else:
+            self.config_directory = os.path.abspath(os.path.join(os.path.dirname(__file__), "profiles"))
+        self._cache = cache
+        self._lazy = lazy
+        self.property_sources: List[PropertySource] = []
+        self.load_times: Dict[str, float] = {}
+
+        property_file_paths = []
+        missing_profiles = []
+        for profile in profiles:
+            property_file_path = self.__get_absolute_file_path(self.stage_config_file_pattern.format(profile=profile))
+            if property_file_path is None:
+                missing_profiles.append(profile)
+            property_file_paths.append(property_file_path)
+        if missing_profiles:
+            raise FileNotFoundError(f"Could not find configuration files for profiles "
+                                    f"{', '.join(repr(profile) for profile in missing_profiles)} "
+                                    f"in '{os.getcwd()}' or '{self.config_directory}'")
+
+        if not property_file_paths:
+            return
+        with ThreadPoolExecutor(max_workers=max_workers or min(len(property_file_paths), 8)) as executor:
+            loaded = list(executor.map(self._load_property_source, property_file_paths))
+        for property_file_path, (property_source, load_time) in zip(property_file_paths, loaded):
+            self.property_sources.append(property_source)
+            self.load_times[property_file_path] = load_time
 
     def get_property_sources(self) -> List[PropertySource]:
         return self.property_sources
 
-    def _add_property_source(self, profile: str) -> None:
-        property_file_name = self.stage_config_file_pattern.format(profile=profile)
-        property_file_path = Path(self.__get_absolute_file_path(property_file_name))
-        config = PyYAMLPropertySource(property_file_path)
-        self.property_sources.append(config)
+    def _load_property_source(self, property_file_path: str) -> Tuple[PyYAMLPropertySource, float]:
+        start = time.perf_counter()
+        property_source = PyYAMLPropertySource(Path(property_file_path), lazy=self._lazy, cache=self._cache)
+        return property_source, time.perf_counter() - start
 
-    def __get_absolute_file_path(self, file) -> str | None | Any:
+    def __get_absolute_file_path(self, file) -> Optional[str]:
         if os.path.isfile(file):
-            return file
+            return os.path.abspath(file)
 
         file_path = os.path.join(self.config_directory, file)
         if os.path.isfile(file_path):
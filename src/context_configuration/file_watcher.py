@@ -0,0 +1,178 @@
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+# IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+_IN_EVENTS = 0x002 | 0x004 | 0x008 | 0x040 | 0x080 | 0x100 | 0x200
+
+
+class _Inotify:
+    """ Minimal inotify binding used to wake the watcher up early, the file signatures decide about changes. """
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+        self.fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._directories = set()
+
+    def add_directory(self, directory: str) -> None:
+        if directory in self._directories:
+            return
+        if self._add_watch(self.fd, os.fsencode(directory), _IN_EVENTS) < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for '{directory}'")
+        self._directories.add(directory)
+
+    def drain(self) -> None:
+        try:
+            while os.read(self.fd, 65536):
+                pass
+        except BlockingIOError:
+            pass
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def _signature(path: str) -> Optional[Tuple[int, int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+class FileWatcher:
+    """ Watches files on a background thread and invokes a callback once a file has stopped changing.
+
+        Files are polled every 'interval' seconds; on Linux inotify wakes the watcher up as soon as a watched
+        directory changes. A change is reported after the file signature (mtime, size, inode) has been stable for
+        'debounce' seconds, so a burst of writes causes a single callback. Callbacks run on the watcher thread,
+        exceptions are logged and do not stop the watcher.
+    """
+
+    def __init__(self, interval: float = 1.0, debounce: float = 0.2, use_inotify: bool = True):
+        self._interval = interval
+        self._debounce = debounce
+        self._use_inotify = use_inotify
+        self._watches: Dict[str, List[Callable[[], None]]] = {}
+        self._signatures: Dict[str, Optional[Tuple[int, int, int]]] = {}
+        self._pending: Dict[str, Tuple[Optional[Tuple[int, int, int]], float]] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._inotify: Optional[_Inotify] = None
+        self._wakeup_read, self._wakeup_write = None, None
+
+    def watch(self, filename: Union[str, Path], callback: Callable[[], None]) -> None:
+        path = os.path.abspath(filename)
+        with self._lock:
+            self._watches.setdefault(path, []).append(callback)
+            self._signatures.setdefault(path, _signature(path))
+            if self._inotify is not None:
+                self._watch_directory(path)
+
+    def watch_source(self, source) -> None:
+        """ Reloads a file backed property source, e.g. a PyYAMLPropertySource, whenever its file changes. """
+        self.watch(source.filename, source.reload)
+
+    def uses_inotify(self) -> bool:
+        return self._inotify is not None
+
+    def start(self) -> "FileWatcher":
+        if self._thread is not None:
+            return self
+        if self._use_inotify:
+            try:
+                self._inotify = _Inotify()
+                with self._lock:
+                    for path in self._watches:
+                        self._watch_directory(path)
+                self._wakeup_read, self._wakeup_write = os.pipe()
+            except (OSError, AttributeError):
+                self._close_inotify()
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="context-configuration-file-watcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._wakeup_write is not None:
+            os.write(self._wakeup_write, b"\0")
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._close_inotify()
+
+    def __enter__(self) -> "FileWatcher":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def check(self) -> None:
+        """ Compares the file signatures once and invokes the callbacks of files which settled after a change. """
+        now = time.monotonic()
+        settled = []
+        with self._lock:
+            for path in self._watches:
+                signature = _signature(path)
+                pending = self._pending.get(path)
+                if pending is not None and pending[0] != signature:
+                    self._pending[path] = (signature, now)
+                elif pending is not None and now - pending[1] >= self._debounce:
+                    del self._pending[path]
+                    self._signatures[path] = signature
+                    settled.append(path)
+                elif pending is None and signature != self._signatures[path]:
+                    self._pending[path] = (signature, now)
+            callbacks = [(path, list(self._watches[path])) for path in settled]
+
+        for path, path_callbacks in callbacks:
+            for callback in path_callbacks:
+                try:
+                    callback()
+                except Exception:
+                    logger.exception("Reloading '%s' failed, keeping the previous configuration", path)
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self.check()
+            timeout = self._debounce if self._pending else self._interval
+            self._wait(timeout)
+
+    def _wait(self, timeout: float) -> None:
+        if self._inotify is None:
+            self._stopped.wait(timeout)
+            return
+        readable, _, _ = select.select([self._inotify.fd, self._wakeup_read], [], [], timeout)
+        if self._inotify.fd in readable:
+            self._inotify.drain()
+
+    def _watch_directory(self, path: str) -> None:
+        try:
+            self._inotify.add_directory(os.path.dirname(path))
+        except OSError:
+            logger.debug("Could not watch the directory of '%s' with inotify, polling it", path)
+
+    def _close_inotify(self) -> None:
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+        for fd in (self._wakeup_read, self._wakeup_write):
+            if fd is not None:
+                os.close(fd)
+        self._wakeup_read, self._wakeup_write = None, None
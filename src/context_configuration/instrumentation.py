@@ -0,0 +1,41 @@
+import threading
+from collections import namedtuple
+from typing import Any, Callable, Dict, List, Optional
+
+KeyStatistics = namedtuple('KeyStatistics', ['hits', 'misses', 'source', 'lookup_time', 'conversion_time'])
+LookupEvent = namedtuple('LookupEvent', ['name', 'type', 'hit', 'source', 'lookup_time', 'conversion_time'])
+
+
+class LookupStatistics:
+    """ Per-key lookup counters of an instrumented ContextConfiguration or property source.
+
+        'source' is the source which served the last lookup of a key, 'lookup_time' and 'conversion_time' are the
+        accumulated seconds spent fetching and converting values on misses. The hook, if given, receives a
+        LookupEvent for every recorded lookup on the calling thread.
+    """
+
+    def __init__(self, hook: Optional[Callable[[LookupEvent], None]] = None):
+        self._hook = hook
+        self._lock = threading.Lock()
+        self._keys: Dict[str, List[Any]] = {}
+
+    def record(self, name: str, cls: Any, hit: bool, source: Any, lookup_time: float = 0.0,
+               conversion_time: float = 0.0) -> None:
+        with self._lock:
+            counters = self._keys.get(name)
+            if counters is None:
+                counters = self._keys[name] = [0, 0, None, 0.0, 0.0]
+            counters[0 if hit else 1] += 1
+            counters[2] = source
+            counters[3] += lookup_time
+            counters[4] += conversion_time
+        if self._hook is not None:
+            self._hook(LookupEvent(name, cls, hit, source, lookup_time, conversion_time))
+
+    def snapshot(self) -> Dict[str, KeyStatistics]:
+        with self._lock:
+            return {name: KeyStatistics(*counters) for name, counters in self._keys.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._keys = {}
@@ -0,0 +1,47 @@
+from collections import namedtuple
+from functools import lru_cache
+from typing import Iterator, Optional, Tuple, Union
+
+Placeholder = namedtuple('Placeholder', ['name', 'default'])
+
+Template = Tuple[Union[str, Placeholder], ...]
+
+
+@lru_cache(maxsize=4096)
+def compile_template(text: str) -> Optional[Template]:
+    """ Splits a string into literal segments and '${name:default}' placeholders.
+
+        Returns None if the string contains neither a placeholder nor an escaped '$${', which stands for a literal
+        '${'. The default is optional ('${name}'), an unterminated placeholder is kept as literal text. The most
+        recently used templates are cached.
+    """
+    segments = []
+    escaped = False
+    position = 0
+    while True:
+        start = text.find("${", position)
+        if start > 0 and text[start - 1] == "$":
+            segments.append(text[position:start - 1] + "${")
+            escaped = True
+            position = start + 2
+            continue
+        end = text.find("}", start + 2) if start != -1 else -1
+        if end == -1:
+            break
+        if start > position:
+            segments.append(text[position:start])
+        name, separator, default = text[start + 2:end].partition(":")
+        segments.append(Placeholder(name.strip(), default if separator else None))
+        position = end + 1
+    if position < len(text):
+        segments.append(text[position:])
+
+    if escaped or any(isinstance(segment, Placeholder) for segment in segments):
+        return tuple(segments)
+    return None
+
+
+def placeholder_names(template: Template) -> Iterator[str]:
+    for segment in template:
+        if isinstance(segment, Placeholder):
+            yield segment.name
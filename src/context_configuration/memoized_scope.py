@@ -0,0 +1,67 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+class MemoizedScope:
+    """ Bean scope for prototype beans which are expensive to construct.
+
+        Instances are cached by the resolved property values they were created from, so a bean is only rebuilt
+        after one of its properties changed. At most 'max_size' instances are kept, the least recently used one is
+        evicted first; with a 'ttl' instances older than 'ttl' seconds are rebuilt as well. A scope can be shared by
+        several beans.
+    """
+
+    def __init__(self, max_size: int = 128, ttl: Optional[float] = None):
+        if max_size < 1:
+            raise ValueError("The maximum size of a memoized scope must be at least 1")
+        self._max_size = max_size
+        self._ttl = ttl
+        self._instances: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """ Returns the instance cached for 'key', creating it with 'factory' if there is none. Keys which are not
+            hashable, e.g. resolved lists, are not cached.
+        """
+        try:
+            hash(key)
+        except TypeError:
+            with self._lock:
+                self.misses += 1
+            return factory()
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._instances.get(key)
+            if entry is not None and (self._ttl is None or now - entry[1] < self._ttl):
+                self._instances.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._instances[key]
+                self.evictions += 1
+            self.misses += 1
+
+        instance = factory()
+        with self._lock:
+            entry = self._instances.get(key)
+            if entry is not None:
+                # another thread created the instance meanwhile, keep a single instance per key
+                return entry[0]
+            self._instances[key] = (instance, now)
+            while len(self._instances) > self._max_size:
+                self._instances.popitem(last=False)
+                self.evictions += 1
+        return instance
+
+    def clear(self) -> None:
+        with self._lock:
+            self._instances.clear()
+
+    def __len__(self) -> int:
+        return len(self._instances)
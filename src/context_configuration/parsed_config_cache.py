@@ -0,0 +1,125 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+CACHE_FORMAT_VERSION = 1
+
+
+def default_cache_directory() -> str:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "context-configuration")
+
+
+class ParsedConfigCache:
+    """ Persists parsed configuration trees on disk so a warm start skips parsing.
+
+        Entries are keyed by the absolute file path and validated against the file size, modification time and a
+        hash of its content; stale entries are rebuilt on access. The cache directory is capped at 'max_size' bytes,
+        evicting the least recently used entries first.
+
+        Entries are stored with pickle, so the cache directory must only be writable by trusted users. It is created
+        with mode 0o700.
+    """
+
+    def __init__(self, directory: Optional[Union[str, Path]] = None, max_size: int = 256 * 1024 * 1024):
+        self._directory = str(directory) if directory is not None else default_cache_directory()
+        self._max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self._directory, mode=0o700, exist_ok=True)
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    def load(self, filename: Union[str, Path], parse: Callable[[bytes], Any]) -> Any:
+        """ Returns the parsed tree of the file, calling 'parse' with the file content on a cache miss. """
+        path = os.path.abspath(filename)
+        with open(path, 'rb') as file:
+            stat = os.fstat(file.fileno())
+            content = file.read()
+        key = {
+            "version": CACHE_FORMAT_VERSION,
+            "path": path,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "digest": hashlib.blake2b(content, digest_size=20).hexdigest(),
+        }
+        entry_path = self._entry_path(path)
+
+        tree = self._read_entry(entry_path, key)
+        if tree is not None:
+            self.hits += 1
+            return tree[0]
+
+        self.misses += 1
+        parsed = parse(content)
+        self._write_entry(entry_path, key, parsed)
+        self._evict()
+        return parsed
+
+    def clear(self) -> None:
+        for entry in self._entries():
+            _remove(entry.path)
+
+    def _entry_path(self, path: str) -> str:
+        return os.path.join(self._directory, hashlib.sha256(path.encode()).hexdigest() + ".pickle")
+
+    def _read_entry(self, entry_path: str, key: dict) -> Optional[tuple]:
+        try:
+            with open(entry_path, 'rb') as entry:
+                if pickle.load(entry) != key:
+                    return None
+                tree = pickle.load(entry)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            _remove(entry_path)
+            return None
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        return (tree,)
+
+    def _write_entry(self, entry_path: str, key: dict, tree: Any) -> None:
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, 'wb') as entry:
+                pickle.dump(key, entry, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(tree, entry, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, entry_path)
+        except Exception:
+            _remove(temporary_path)
+            raise
+
+    def _entries(self):
+        with os.scandir(self._directory) as entries:
+            return [entry for entry in entries if entry.name.endswith(".pickle") and entry.is_file()]
+
+    def _evict(self) -> None:
+        entries = []
+        total_size = 0
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+            total_size += stat.st_size
+
+        entries.sort()
+        while total_size > self._max_size and len(entries) > 1:
+            _, size, path = entries.pop(0)
+            _remove(path)
+            total_size -= size
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
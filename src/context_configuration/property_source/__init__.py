@@ -1,5 +1,40 @@
-from .abstract_property_source import AbstractPropertySource
-from .cli_property_source import CLIPropertySource
-from .dictionary_property_source import DictionaryPropertySource
-from .env_vars_property_source import EnvVarsPropertySource
-from .pyyaml_property_source import PyYAMLPropertySource
\ No newline at end of file
+from typing import TYPE_CHECKING
+
+from .._lazy_imports import lazy_attributes
+
+if TYPE_CHECKING:
+    from .abstract_property_source import AbstractPropertySource
+    from .cli_property_source import CLIPropertySource
+    from .compiled_overlay_property_source import CompiledOverlayPropertySource
+    from .dictionary_property_source import DictionaryPropertySource
+    from .env_vars_property_source import EnvVarsPropertySource
+    from .http_property_source import HttpPropertySource
+    from .pyyaml_property_source import PyYAMLPropertySource
+    from .snapshot_property_source import SnapshotPropertySource
+    from .streaming_pyyaml_property_source import StreamingPyYAMLPropertySource
+
+_IMPORTS = {
+    "AbstractPropertySource": ".abstract_property_source",
+    "CLIPropertySource": ".cli_property_source",
+    "CompiledOverlayPropertySource": ".compiled_overlay_property_source",
+    "DictionaryPropertySource": ".dictionary_property_source",
+    "EnvVarsPropertySource": ".env_vars_property_source",
+    "HttpPropertySource": ".http_property_source",
+    "PyYAMLPropertySource": ".pyyaml_property_source",
+    "SnapshotPropertySource": ".snapshot_property_source",
+    "StreamingPyYAMLPropertySource": ".streaming_pyyaml_property_source",
+}
+
+__all__ = (
+    "AbstractPropertySource",
+    "CLIPropertySource",
+    "CompiledOverlayPropertySource",
+    "DictionaryPropertySource",
+    "EnvVarsPropertySource",
+    "HttpPropertySource",
+    "PyYAMLPropertySource",
+    "SnapshotPropertySource",
+    "StreamingPyYAMLPropertySource",
+)
+
+__getattr__, __dir__ = lazy_attributes(globals(), _IMPORTS)
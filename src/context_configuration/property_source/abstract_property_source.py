@@ -1,24 +1,136 @@
 from abc import ABC
-from typing import Dict, Callable, Optional, Any
+from time import perf_counter
+from types import MappingProxyType
+from typing import Dict, Callable, Optional, Any, Mapping, List, Iterable, Tuple, FrozenSet
 
+from ..converter.converter_registry import ConverterRegistry
 from ..converter.default_converter import default_converter, convert
+from ..instrumentation import KeyStatistics, LookupEvent, LookupStatistics
 from ..protocol.converter import Converter
 from ..protocol.property_source import OrderedPropertySource, P
 
+_MISSING = object()
+
+
+def flatten_properties(properties: Any, prefix: str = "") -> Dict[str, Any]:
+    """ Flattens a nested dictionary into a 'dotted.key -> value' dictionary.
+
+        Every level is indexed, so 'a.b' maps to the nested dictionary and 'a.b.c' to its value. Keys which
+        cannot be addressed with a dotted name (non-strings, empty strings, strings containing a dot) are skipped.
+    """
+    flat = {}
+    if not isinstance(properties, dict):
+        return flat
+    for key, value in properties.items():
+        if not isinstance(key, str) or key == "" or "." in key:
+            continue
+        dotted_key = f"{prefix}{key}"
+        flat[dotted_key] = value
+        if isinstance(value, dict):
+            flat.update(flatten_properties(value, f"{dotted_key}."))
+    return flat
+
+
+def index_flat_properties(flat: Mapping[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """ Builds the nested tree and the flat index from 'dotted.key -> value' pairs.
+
+        Keys are processed in sorted order. A key which is both a value and the parent of other keys (e.g. 'db' and
+        'db.pool') keeps its value; its children are still indexed under their dotted names but not added to the
+        tree. Names which are empty, start or end with a dot or contain two consecutive dots are skipped.
+    """
+    tree = {}
+    index = {}
+    for key in sorted(flat):
+        if not _is_valid_name(key):
+            continue
+        index[key] = flat[key]
+        *parents, leaf = key.split(".")
+        level = tree
+        for part in parents:
+            child = level.setdefault(part, {})
+            if not isinstance(child, dict):
+                break
+            level = child
+        else:
+            if not isinstance(level.get(leaf), dict):
+                level[leaf] = flat[key]
+    for key, value in flatten_properties(tree).items():
+        index.setdefault(key, value)
+    return tree, index
+
+
+def _is_valid_name(name: Any) -> bool:
+    return isinstance(name, str) and name != "" and ".." not in name and not name.startswith(".") \
+        and not name.endswith(".")
+
+
+def changed_names(old_index: Optional[Mapping[str, Any]],
+                  new_index: Optional[Mapping[str, Any]]) -> Optional[FrozenSet[str]]:
+    """ Returns the dotted keys which were added, removed or changed between two flat indexes, or None if one of
+        them is missing.
+
+        Nested dictionaries are not compared, a change below a key is reported with the dotted name of the changed
+        value only.
+    """
+    if old_index is None or new_index is None:
+        return None
+    changed = set()
+    for key, value in new_index.items():
+        old_value = old_index.get(key, _MISSING)
+        if isinstance(value, dict) and isinstance(old_value, dict):
+            continue
+        if type(old_value) is not type(value) or old_value != value:
+            changed.add(key)
+    changed.update(key for key in old_index if key not in new_index)
+    return frozenset(changed)
+
+
+def merge_property_indexes(sources: Iterable[Any]) -> Dict[str, Tuple[Any, Any]]:
+    """ Merges the flat indexes of the given sources into 'dotted.key -> (value, source)'.
+
+        Sources are given in order of precedence, the first source defining a key wins. Raises a ValueError if a
+        source cannot enumerate its properties.
+    """
+    merged = {}
+    for source in sources:
+        index = source.property_index() if hasattr(source, "property_index") else None
+        if index is None:
+            raise ValueError(f"Property source '{source}' cannot enumerate its properties.")
+        for key, value in index.items():
+            if key not in merged:
+                merged[key] = (value, source)
+    return merged
+
 
 class AbstractPropertySource(OrderedPropertySource, ABC):
     _properties: Optional[Dict[str, Any]] = None
-    _converter: Dict[type, Callable] = {}
+    _index: Optional[Mapping[str, Any]] = None
+    _converter: ConverterRegistry
     _order: int = 0
+    _change_listeners: List[Callable[[Optional[FrozenSet[str]]], None]]
+    _statistics: Optional[LookupStatistics] = None
 
     def __init__(self, order=0):
         self._order = order
-        self._converter = default_converter()
+        self._converter = ConverterRegistry(default_converter())
+        self._change_listeners = []
 
     def add_converter(self, converter: Converter):
         self._converter[converter.for_type()] = converter.convert
 
+    def add_change_listener(self, listener: Callable[[Optional[FrozenSet[str]]], None]) -> None:
+        """ Registers a callable which is invoked whenever the properties of this source change, with the dotted
+            names of the changed properties, or None if the source cannot tell which properties changed.
+        """
+        self._change_listeners.append(listener)
+
+    def remove_change_listener(self, listener: Callable[[Optional[FrozenSet[str]]], None]) -> None:
+        self._change_listeners.remove(listener)
+
     def contains_property(self, name: str) -> bool:
+        index = self._index
+        if index is not None:
+            return name in index
         try:
             self._get(name)
             return True
@@ -26,11 +138,11 @@ class AbstractPropertySource(OrderedPropertySource, ABC):
             return False
 
     def get_property(self, name: str, cls: Optional[P] = None):
-        if (name is None) or (name == "") or (".." in name) or (name.startswith(".")) or (name.endswith(".")):
-            raise KeyError("Property name cannot be empty, start or end with a dot "
-                           "or contain two consecutive dots ('..')")
-
-        value = self._get(name)
+        index = self._index
+        value = _MISSING if index is None else index.get(name, _MISSING)
+        if value is _MISSING:
+            self._validate_name(name)
+            value = self._get(name)
 
         if cls is None:
             return value
@@ -43,12 +155,67 @@ class AbstractPropertySource(OrderedPropertySource, ABC):
     def get_order(self) -> int:
         return self._order
 
+    def property_index(self) -> Optional[Mapping[str, Any]]:
+        """ Returns the flat 'dotted.key -> value' index, or None if the source cannot enumerate its properties. """
+        return self._index
+
+    def enable_instrumentation(self, hook: Optional[Callable[[LookupEvent], None]] = None) -> LookupStatistics:
+        """ Starts recording the 'get_property' calls of this source per key: found (hit) or missing (miss), and the
+            time spent on the lookup and on the conversion. 'get_property' is replaced on this instance only.
+        """
+        statistics = LookupStatistics(hook)
+        record = statistics.record
+        lookup = type(self).get_property
+
+        def get_property(name: str, cls: Optional[P] = None):
+            start = perf_counter()
+            try:
+                value = lookup(self, name, None)
+            except KeyError:
+                record(name, cls, False, self, perf_counter() - start)
+                raise
+            found = perf_counter()
+            if cls is not None and type(value) is not cls:
+                value = convert(value, self._converter, cls)
+            record(name, cls, True, self, found - start, perf_counter() - found)
+            return value
+
+        self.get_property = get_property
+        self._statistics = statistics
+        return statistics
+
+    def disable_instrumentation(self) -> None:
+        self.__dict__.pop("get_property", None)
+        self._statistics = None
+
+    def stats(self) -> Dict[str, KeyStatistics]:
+        """ Returns a snapshot of the per-key lookup statistics, empty if instrumentation is disabled. """
+        if self._statistics is None:
+            return {}
+        return self._statistics.snapshot()
+
+    def _notify_change(self, names: Optional[FrozenSet[str]] = None) -> None:
+        for listener in list(self._change_listeners):
+            listener(names)
+
+    def _build_index(self) -> None:
+        self._index = MappingProxyType(flatten_properties(self._properties))
+
+    def _validate_name(self, name: str) -> None:
+        if not _is_valid_name(name):
+            raise KeyError("Property name cannot be empty, start or end with a dot "
+                           "or contain two consecutive dots ('..')")
+
     def _get(self, name: str) -> Any:
-        key_levels = name.split(".")
+        index = self._index
+        if index is not None:
+            if name not in index:
+                raise KeyError(f"Could not find property '{name}'")
+            return index[name]
+
         properties_level = self._properties
-        while 0 < len(key_levels):
-            key = key_levels.pop(0)
-            if key not in properties_level:
+        for key in name.split("."):
+            if not isinstance(properties_level, dict) or key not in properties_level:
                 raise KeyError(f"Could not find property '{name}'")
             properties_level = properties_level[key]
         return properties_level
@@ -1,77 +1,93 @@
+import os
 import sys
-from typing import List, Any
+from types import MappingProxyType
+from typing import IO, Dict, Iterable, Iterator, List, Any, Optional, Tuple
 
-from ..property_source.abstract_property_source import AbstractPropertySource
+from ..property_source.abstract_property_source import AbstractPropertySource, index_flat_properties
 
 
 class CLIPropertySource(AbstractPropertySource):
+    """ Property source backed by command line arguments.
 
-    def __init__(self):
+        Accepts '--name=value', '--name value' and '-name value'. Dotted names such as '--db.pool.size=10' are
+        indexed like the file sources, so they override nested keys. Repeated names collect their values in a list.
+        With 'argument_files' set, an argument '@path' which is not the value of an option reads further arguments
+        from the file, one per line; the file is streamed, so very large override sets do not have to fit into the
+        command line.
+    """
+
+    def __init__(self, argv: Optional[List[str]] = None, argument_files: bool = False):
         super().__init__()
-        self._properties = {}
-        cli_arguments = sys.argv
-        argument_list = cli_arguments[1:]
+        self._arguments: Dict[str, Any] = {}
+        self._argument_files = argument_files
+        argument_list = sys.argv[1:] if argv is None else argv
         self._parse_arguments(argument_list)
-
-    def _get(self, name: str) -> Any:
-        if name not in self._properties:
-            raise KeyError(f"Could not find property '{name}'")
-        return self._properties[name]
-
-    def _parse_arguments(self, argument_list: List[str]) -> None:
-        while len(argument_list) != 0:
-            argument = argument_list.pop(0)
-            if argument.startswith("--"):
-                self._parse_double_dash_argument(argument, argument_list)
-                continue
-            if argument.startswith("-"):
-                self._parse_single_dash_argument(argument, argument_list)
-                continue
-
-    def _parse_double_dash_argument(self, argument: str, argument_list: List[str]) -> None:
-        argument = argument[2:]
+        properties, index = index_flat_properties(self._arguments)
+        self._properties = properties
+        self._index = MappingProxyType(index)
+
+    def _parse_arguments(self, arguments: Iterable[str]) -> None:
+        pending_name = None
+        # iterators of the command line and of the argument files currently read, with the open files
+        stack: List[Tuple[Iterator[str], Optional[str], Optional[IO]]] = [(iter(arguments), None, None)]
+        try:
+            while stack:
+                argument = next(stack[-1][0], None)
+                if argument is None:
+                    _, _, file = stack.pop()
+                    if file is not None:
+                        file.close()
+                    continue
+
+                if pending_name is not None and not argument.startswith("-"):
+                    self._add_to_argument_list(pending_name, argument)
+                    pending_name = None
+                    continue
+                pending_name = None
+
+                if self._argument_files and argument.startswith("@") and len(argument) > 1:
+                    stack.append(self._open_argument_file(argument[1:], stack))
+                    continue
+                if argument.startswith("--"):
+                    pending_name = self._parse_double_dash_argument(argument[2:])
+                    continue
+                if argument.startswith("-"):
+                    pending_name = argument[1:] or None
+        finally:
+            for _, _, file in stack:
+                if file is not None:
+                    file.close()
+
+    @staticmethod
+    def _open_argument_file(filename: str, stack: List[Tuple[Iterator[str], Optional[str], Optional[IO]]]) \
+            -> Tuple[Iterator[str], str, IO]:
+        path = os.path.abspath(filename)
+        if any(open_path == path for _, open_path, _ in stack):
+            raise ValueError(f"Argument file '{path}' includes itself")
+        file = open(path, 'r')
+        lines = (line.rstrip("\r\n") for line in file)
+        return (line for line in lines if line.strip()), path, file
+
+    def _parse_double_dash_argument(self, argument: str) -> Optional[str]:
         if "=" in argument:
-            cli_property = argument.split("=", 1)
-            if len(cli_property[0]) == 0:
-                return
-            self._add_to_argument_list(cli_property[0], cli_property[1])
-            return
-
-        if len(argument_list) == 0:
-            return
-
-        next_arg = argument_list[0]
-        if next_arg.startswith("-"):
-            return
-
-        self._add_to_argument_list(argument, argument_list.pop(0))
-
-    def _parse_single_dash_argument(self, argument: str, argument_list: List[str]):
-        argument = argument[1:]
-        if len(argument) == 0:
-            return
-
-        if len(argument_list) == 0:
-            return
-
-        next_arg = argument_list[0]
-        if next_arg.startswith("-"):
-            return
-
-        self._add_to_argument_list(argument, argument_list.pop(0))
+            name, value = argument.split("=", 1)
+            if len(name) != 0:
+                self._add_to_argument_list(name, value)
+            return None
+        return argument or None
 
     def _add_to_argument_list(self, argument_name: str, argument_value: str) -> None:
         argument_value = self._clean_argument_value(argument_value)
 
-        if argument_name not in self._properties:
-            self._properties[argument_name] = argument_value
+        if argument_name not in self._arguments:
+            self._arguments[argument_name] = argument_value
             return
 
-        if isinstance(self._properties[argument_name], list):
-            self._properties[argument_name].append(argument_value)
+        if isinstance(self._arguments[argument_name], list):
+            self._arguments[argument_name].append(argument_value)
             return
 
-        self._properties[argument_name] = [self._properties[argument_name], argument_value]
+        self._arguments[argument_name] = [self._arguments[argument_name], argument_value]
 
     def _clean_argument_value(self, argument_value):
         for character in ["'", '"']:
@@ -0,0 +1,50 @@
+from types import MappingProxyType
+from typing import FrozenSet, Mapping, Optional, Sequence
+
+from .abstract_property_source import AbstractPropertySource, changed_names, merge_property_indexes
+from ..protocol.property_source import OrderedPropertySource
+
+
+class CompiledOverlayPropertySource(AbstractPropertySource):
+    """ Merges the indexes of several property sources into a single flat index.
+
+        Sources are given in order of precedence; for every dotted key the index holds the value of the first source
+        defining it, so a lookup is one probe regardless of the number of merged sources. Nested dictionaries are
+        taken from the winning source as they are, they are not merged. The overlay is recompiled whenever one of
+        the merged sources reports a change.
+    """
+
+    def __init__(self, property_sources: Sequence[OrderedPropertySource], order: Optional[int] = None) -> None:
+        property_sources = list(property_sources)
+        if order is None:
+            order = property_sources[0].get_order() if property_sources else 0
+        super().__init__(order)
+        self._property_sources = property_sources
+        self._winners: Mapping[str, OrderedPropertySource] = MappingProxyType({})
+        self._compile()
+        for source in property_sources:
+            if hasattr(source, "add_change_listener"):
+                source.add_change_listener(self._on_source_change)
+
+    def property_sources(self):
+        return list(self._property_sources)
+
+    def source_of(self, name: str) -> OrderedPropertySource:
+        """ Returns the merged property source the value of the property is taken from. """
+        try:
+            return self._winners[name]
+        except KeyError:
+            raise KeyError(f"Could not find property '{name}'") from None
+
+    def _compile(self) -> None:
+        merged = merge_property_indexes(self._property_sources)
+        winners = MappingProxyType({key: source for key, (_, source) in merged.items()})
+        index = MappingProxyType({key: value for key, (value, _) in merged.items()})
+        self._winners = winners
+        self._index = index
+
+    def _on_source_change(self, names: Optional[FrozenSet[str]] = None) -> None:
+        # changes of a merged source are shadowed by the sources before it, so the merged indexes are compared
+        old_index = self._index
+        self._compile()
+        self._notify_change(changed_names(old_index, self._index))
@@ -1,10 +1,27 @@
 from typing import Dict
 
-from .abstract_property_source import AbstractPropertySource
+from .abstract_property_source import AbstractPropertySource, changed_names
 
 
 class DictionaryPropertySource(AbstractPropertySource):
 
-    def __init__(self, properties: Dict[str, any]):
+    def __init__(self, properties: Dict[str, any], mutable: bool = False):
+        """ Creates a property source from a (nested) dictionary.
+
+            Unless 'mutable' is set, the dictionary is indexed once on construction and later changes to it are not
+            visible. Mutable sources walk the nested dictionary on every lookup instead.
+        """
         super().__init__()
         self._properties = properties
+        self._mutable = mutable
+        if not mutable:
+            self._build_index()
+
+    def refresh(self) -> None:
+        """ Picks up changes made to the underlying dictionary and notifies the change listeners. """
+        if self._mutable:
+            self._notify_change()
+            return
+        old_index = self._index
+        self._build_index()
+        self._notify_change(changed_names(old_index, self._index))
@@ -1,15 +1,59 @@
 import os
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Optional
 
-from .abstract_property_source import AbstractPropertySource
+from .abstract_property_source import AbstractPropertySource, changed_names, index_flat_properties
+
+
+def environment_name_to_property_name(name: str) -> str:
+    """ Maps an environment variable name to a dotted property name: 'DB_POOL_SIZE' becomes 'db.pool.size' and a
+        double underscore stands for a literal one, 'MAX__SIZE' becomes 'max_size'.
+    """
+    return name.lower().replace("__", "\0").replace("_", ".").replace("\0", "_")
 
 
 class EnvVarsPropertySource(AbstractPropertySource):
+    """ Property source backed by the environment variables.
+
+        By default every lookup queries 'os.environ' with the property name as given. In snapshot mode the
+        environment is read once on construction (and on 'refresh'): variables starting with 'prefix' are mapped to
+        dotted property names with 'environment_name_to_property_name' after stripping the prefix, so 'APP_DB_HOST'
+        overrides 'db.host' with prefix 'APP_'.
+    """
 
-    def __init__(self):
+    def __init__(self, prefix: Optional[str] = None, snapshot: bool = False):
         super().__init__()
+        self._prefix = prefix or ""
+        self._snapshot = snapshot
+        if snapshot:
+            self._take_snapshot()
+
+    def is_dynamic(self) -> bool:
+        """ Returns True unless in snapshot mode, as the live environment changes without notifying listeners. """
+        return not self._snapshot
+
+    def refresh(self) -> None:
+        """ Reads the environment again in snapshot mode and notifies the change listeners. """
+        if not self._snapshot:
+            self._notify_change()
+            return
+        old_index = self._index
+        self._take_snapshot()
+        self._notify_change(changed_names(old_index, self._index))
+
+    def _take_snapshot(self) -> None:
+        prefix = self._prefix
+        flat = {}
+        for name, value in os.environ.copy().items():
+            if name.startswith(prefix) and len(name) > len(prefix):
+                flat[environment_name_to_property_name(name[len(prefix):])] = value
+        properties, index = index_flat_properties(flat)
+        self._properties = properties
+        self._index = MappingProxyType(index)
 
     def _get(self, name: str) -> Any:
+        if self._snapshot:
+            return super()._get(name)
         if name not in os.environ:
             raise KeyError(f"Could not find property '{name}'")
         return os.environ[name]
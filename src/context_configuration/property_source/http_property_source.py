@@ -0,0 +1,184 @@
+import http.client
+import json
+import logging
+import queue
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+import yaml
+
+from .abstract_property_source import AbstractPropertySource, changed_names, flatten_properties
+from .pyyaml_property_source import SafeLoader
+
+logger = logging.getLogger(__name__)
+
+
+class StaleConfigurationError(RuntimeError):
+    pass
+
+
+class HttpPropertySource(AbstractPropertySource):
+    """ Property source backed by a configuration document served over HTTP(S).
+
+        The document (JSON, or YAML if the server says so in the content type) is fetched on construction and
+        refreshed every 'refresh_interval' seconds on a background thread. Refreshes send the last ETag in an
+        'If-None-Match' header, so an unchanged document costs a '304 Not Modified'. Requests reuse up to
+        'pool_size' keep-alive connections.
+
+        If the server cannot be reached, the last document keeps being served for up to 'max_staleness' seconds
+        after the last successful request; after that lookups raise a StaleConfigurationError. The refresh thread
+        then notifies the change listeners, so a ContextConfiguration drops the values it cached from this source.
+        Without a refresh thread ('refresh_interval' None) only direct lookups on the source check the bound.
+        The property index checks the bound as well, and the source is never compiled into an overlay, which
+        would keep serving a copy of the stale document.
+    """
+
+    def __init__(self, url: str, refresh_interval: Optional[float] = 30.0, max_staleness: float = 300.0,
+                 pool_size: int = 2, timeout: float = 5.0, headers: Optional[Dict[str, str]] = None,
+                 order: int = 0) -> None:
+        super().__init__(order)
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme '{parts.scheme}', expecting 'http' or 'https'.")
+        self._connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self._host = parts.netloc
+        self._path = parts.path or "/"
+        if parts.query:
+            self._path = f"{self._path}?{parts.query}"
+        self._timeout = timeout
+        self._headers = dict(headers or {})
+        self._max_staleness = max_staleness
+        self._connections = queue.LifoQueue(maxsize=pool_size)
+        self._refresh_lock = threading.Lock()
+        self._etag: Optional[str] = None
+        self._last_success = 0.0
+        self.fetches = 0
+        self.not_modified = 0
+
+        self.refresh()
+
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        if refresh_interval is not None:
+            self._thread = threading.Thread(target=self._refresh_periodically, args=(refresh_interval,),
+                                            name="context-configuration-http-refresh", daemon=True)
+            self._thread.start()
+
+    def staleness(self) -> float:
+        """ Seconds since the document was last confirmed by the server. """
+        return time.monotonic() - self._last_success
+
+    def contains_property(self, name: str) -> bool:
+        self._check_staleness()
+        return super().contains_property(name)
+
+    def get_property(self, name: str, cls: Optional[Any] = None):
+        self._check_staleness()
+        return super().get_property(name, cls)
+
+    def property_index(self) -> Optional[Mapping[str, Any]]:
+        self._check_staleness()
+        return super().property_index()
+
+    def is_compilable(self) -> bool:
+        return False
+
+    def refresh(self) -> bool:
+        """ Fetches the document if it changed. Returns True if new properties were swapped in. """
+        with self._refresh_lock:
+            headers = dict(self._headers)
+            if self._etag is not None:
+                headers["If-None-Match"] = self._etag
+            status, response_headers, body = self._request(headers)
+
+            if status == 304:
+                self.not_modified += 1
+                self._last_success = time.monotonic()
+                return False
+            if status != 200:
+                raise ConnectionError(f"Configuration server responded with status {status}")
+
+            properties = self._parse(response_headers.get("Content-Type", ""), body)
+            index = MappingProxyType(flatten_properties(properties))
+            names = changed_names(self._index, index)
+            self._properties = properties
+            self._index = index
+            self._etag = response_headers.get("ETag")
+            self._last_success = time.monotonic()
+            self.fetches += 1
+        self._notify_change(names)
+        return True
+
+    def close(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        while True:
+            try:
+                self._connections.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def _check_staleness(self) -> None:
+        staleness = time.monotonic() - self._last_success
+        if staleness > self._max_staleness:
+            raise StaleConfigurationError(f"Configuration from '{self._host}{self._path}' is stale "
+                                          f"({staleness:.1f}s since the last successful refresh)")
+
+    def _refresh_periodically(self, refresh_interval: float) -> None:
+        # wakes up at the staleness bound at the latest, so the listeners learn when the document became stale
+        timeout = min(refresh_interval, self._max_staleness)
+        notified_stale = False
+        while not self._stopped.wait(timeout):
+            try:
+                self.refresh()
+                notified_stale = False
+            except Exception:
+                logger.warning("Refreshing configuration from '%s%s' failed, serving the previous document",
+                               self._host, self._path, exc_info=True)
+            remaining = self._max_staleness - self.staleness()
+            if remaining <= 0 and not notified_stale:
+                notified_stale = True
+                self._notify_change(frozenset(self._index))
+            timeout = min(refresh_interval, remaining) if remaining > 0 else refresh_interval
+
+    def _request(self, headers: Dict[str, str]):
+        while True:
+            try:
+                connection = self._connections.get_nowait()
+                reused = True
+            except queue.Empty:
+                connection = self._connection_class(self._host, timeout=self._timeout)
+                reused = False
+            try:
+                connection.request("GET", self._path, headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+                break
+            except ConnectionError:
+                connection.close()
+                if not reused:
+                    raise
+                # the server closed the idle keep-alive connection, retry with the next one
+            except Exception:
+                connection.close()
+                raise
+
+        if response.will_close:
+            connection.close()
+        else:
+            try:
+                self._connections.put_nowait(connection)
+            except queue.Full:
+                connection.close()
+        return response.status, response.headers, body
+
+    @staticmethod
+    def _parse(content_type: str, body: bytes) -> Any:
+        if "yaml" in content_type:
+            return yaml.load(body, Loader=SafeLoader)
+        return json.loads(body)
@@ -1,13 +1,85 @@
+import threading
+import time
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
 import yaml
 
-from .abstract_property_source import AbstractPropertySource
+from .abstract_property_source import AbstractPropertySource, changed_names, flatten_properties
+from ..parsed_config_cache import ParsedConfigCache
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
 
 
 class PyYAMLPropertySource(AbstractPropertySource):
+    """ Property source backed by a YAML file.
+
+        The file is parsed with libyaml when PyYAML was built with it. With 'lazy' set, parsing is deferred until
+        the first property is accessed. 'load_time' holds the seconds spent reading and indexing the file once it
+        has been loaded. Given a 'cache', parsed trees are reused across processes as long as the file is unchanged.
+        'reload' parses the file again and swaps the new tree in at once, see 'FileWatcher' to reload on changes.
+    """
 
-    def __init__(self, filename: Path) -> None:
+    load_time: Optional[float] = None
+
+    def __init__(self, filename: Path, lazy: bool = False, cache: Optional[ParsedConfigCache] = None) -> None:
         super().__init__()
-        with open(filename, 'r') as file:
-            self._properties = yaml.safe_load(file)
+        self._filename = filename
+        self._cache = cache
+        self._load_lock = threading.Lock()
+        if not lazy:
+            self._load()
+
+    @property
+    def filename(self) -> Path:
+        return self._filename
+
+    def is_loaded(self) -> bool:
+        return self._index is not None
+
+    def reload(self) -> None:
+        """ Parses the file again and notifies the change listeners of the properties which changed.
+
+            Readers keep using the previous index until the new one has been built completely. If the file cannot be
+            parsed, the error is raised and the previous properties stay in place.
+        """
+        with self._load_lock:
+            old_index = self._index
+            self._load()
+            names = changed_names(old_index, self._index)
+        self._notify_change(names)
+
+    def property_index(self) -> Optional[Mapping[str, Any]]:
+        if self._index is None:
+            self._ensure_loaded()
+        return self._index
+
+    def _get(self, name: str) -> Any:
+        if self._index is None:
+            self._ensure_loaded()
+        return super()._get(name)
+
+    def _ensure_loaded(self) -> None:
+        with self._load_lock:
+            if self._index is None:
+                self._load()
+
+    def _load(self) -> None:
+        start = time.perf_counter()
+        if self._cache is not None:
+            properties = self._cache.load(self._filename, _parse)
+        else:
+            with open(self._filename, 'rb') as file:
+                properties = _parse(file)
+        index = MappingProxyType(flatten_properties(properties))
+        self._properties = properties
+        self._index = index
+        self.load_time = time.perf_counter() - start
+
+
+def _parse(content) -> Any:
+    return yaml.load(content, Loader=SafeLoader)
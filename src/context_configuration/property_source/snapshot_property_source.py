@@ -0,0 +1,148 @@
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+
+from .abstract_property_source import AbstractPropertySource, merge_property_indexes
+
+MAGIC = b"CCSNAP01"
+
+# magic, number of properties, number of hash table slots
+_HEADER = struct.Struct("<8sII")
+# key hash, unused, record offset (0 marks an empty slot)
+_SLOT = struct.Struct("<IIQ")
+# key length, value length, value tag
+_RECORD = struct.Struct("<IIB")
+
+_TAG_STRING = 0
+_TAG_PICKLE = 1
+_TAG_MAP = 2
+
+
+def write_snapshot(properties: Mapping[str, Any], path: Union[str, Path]) -> None:
+    """ Writes a flat 'dotted.key -> value' mapping into a snapshot file.
+
+        Dictionaries whose keys are all indexed are stored as a list of their child keys and rebuilt from the
+        children on lookup, so nested values are not stored twice.
+    """
+    children: Dict[str, List[str]] = {}
+    for key in properties:
+        parent, _, child = key.rpartition(".")
+        if parent:
+            children.setdefault(parent, []).append(child)
+
+    slot_count = 8
+    while slot_count < 2 * len(properties):
+        slot_count *= 2
+
+    records_start = _HEADER.size + slot_count * _SLOT.size
+    slots: List[Optional[Tuple[int, int]]] = [None] * slot_count
+    records = bytearray()
+    for key, value in properties.items():
+        encoded_key = key.encode()
+        tag, encoded_value = _encode(value, children.get(key, ()))
+        offset = records_start + len(records)
+        records += _RECORD.pack(len(encoded_key), len(encoded_value), tag)
+        records += encoded_key
+        records += encoded_value
+
+        key_hash = zlib.crc32(encoded_key)
+        position = key_hash & (slot_count - 1)
+        while slots[position] is not None:
+            position = (position + 1) & (slot_count - 1)
+        slots[position] = (key_hash, offset)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, 'wb') as file:
+            file.write(_HEADER.pack(MAGIC, len(properties), slot_count))
+            for slot in slots:
+                file.write(_SLOT.pack(0, 0, 0) if slot is None else _SLOT.pack(slot[0], 0, slot[1]))
+            file.write(records)
+        os.replace(temporary_path, path)
+    except Exception:
+        os.remove(temporary_path)
+        raise
+
+
+def _encode(value: Any, children) -> Tuple[int, bytes]:
+    if type(value) is str:
+        return _TAG_STRING, value.encode()
+    if type(value) is dict and all(isinstance(key, str) and key != "" and "." not in key for key in value):
+        return _TAG_MAP, pickle.dumps(children, protocol=pickle.HIGHEST_PROTOCOL)
+    return _TAG_PICKLE, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+class SnapshotPropertySource(AbstractPropertySource):
+    """ Read-only property source served from a memory-mapped snapshot file.
+
+        A snapshot is written once, e.g. by the master process of a pre-fork server, with 'freeze'. Workers attach
+        to the file and share its pages through the page cache instead of holding their own copy of every source.
+        Lookups probe an open-addressing hash table in the file and decode only the requested value.
+    """
+
+    def __init__(self, filename: Union[str, Path], order: int = 0) -> None:
+        super().__init__(order)
+        self._filename = filename
+        with open(filename, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._size, self._slot_count = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"File '{filename}' is not a configuration snapshot.")
+        self._view = memoryview(self._mmap)
+
+    @classmethod
+    def freeze(cls, configuration: Any, filename: Union[str, Path], order: int = 0) -> "SnapshotPropertySource":
+        """ Writes the merged properties of a ContextConfiguration (or a list of sources) into a snapshot file and
+            attaches to it.
+        """
+        sources = configuration.property_sources() if hasattr(configuration, "property_sources") else configuration
+        merged = merge_property_indexes(sources)
+        write_snapshot({key: value for key, (value, _) in merged.items()}, filename)
+        return cls(filename, order)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def close(self) -> None:
+        self._view.release()
+        self._mmap.close()
+
+    def contains_property(self, name: str) -> bool:
+        return self._find(name) is not None
+
+    def _get(self, name: str) -> Any:
+        record = self._find(name)
+        if record is None:
+            raise KeyError(f"Could not find property '{name}'")
+        tag, start, end = record
+        if tag == _TAG_STRING:
+            return str(self._view[start:end], 'utf-8')
+        if tag == _TAG_MAP:
+            return {child: self._get(f"{name}.{child}") for child in pickle.loads(self._view[start:end])}
+        return pickle.loads(self._view[start:end])
+
+    def _find(self, name: str) -> Optional[Tuple[int, int, int]]:
+        if not isinstance(name, str):
+            return None
+        encoded_name = name.encode()
+        key_hash = zlib.crc32(encoded_name)
+        mask = self._slot_count - 1
+        position = key_hash & mask
+        while True:
+            slot_hash, _, offset = _SLOT.unpack_from(self._mmap, _HEADER.size + position * _SLOT.size)
+            if offset == 0:
+                return None
+            if slot_hash == key_hash:
+                key_length, value_length, tag = _RECORD.unpack_from(self._mmap, offset)
+                key_start = offset + _RECORD.size
+                if self._view[key_start:key_start + key_length] == encoded_name:
+                    value_start = key_start + key_length
+                    return tag, value_start, value_start + value_length
+            position = (position + 1) & mask
@@ -0,0 +1,240 @@
+import re
+import threading
+import time
+from collections import namedtuple
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+import yaml
+from yaml.resolver import Resolver
+
+from .abstract_property_source import AbstractPropertySource
+from .pyyaml_property_source import SafeLoader, _parse
+
+_STRING_TAG = "tag:yaml.org,2002:str"
+_MISSING = object()
+# line breaks counted by the parser besides '\n' and '\r\n': a lone '\r', NEL, LINE and PARAGRAPH SEPARATOR
+_OTHER_LINE_BREAKS = re.compile(rb"\r(?!\n)|\xc2\x85|\xe2\x80[\xa8\xa9]")
+
+# position of a value in the file: lines and character columns as reported by the parser, 'block' marks block
+# collections, whose lines are dedented by 'start_column' before they are parsed on their own
+_Span = namedtuple('_Span', ['start_line', 'start_column', 'end_line', 'end_column', 'block'])
+
+
+class _Unsupported(Exception):
+    """ Raised while scanning documents which cannot be split into subtrees. """
+
+
+class _Frame:
+    __slots__ = ("is_mapping", "prefix", "depth", "expect_key", "key", "name", "start_mark", "block")
+
+    def __init__(self, is_mapping: bool, prefix: Optional[str], depth: int, name: Optional[str], start_mark: Any,
+                 block: bool):
+        self.is_mapping = is_mapping
+        self.prefix = prefix
+        self.depth = depth
+        self.expect_key = True
+        self.key = None
+        self.name = name
+        self.start_mark = start_mark
+        self.block = block
+
+
+class StreamingPyYAMLPropertySource(AbstractPropertySource):
+    """ Property source for very large YAML files which parses only the subtrees that are accessed.
+
+        On construction the event stream of the file is scanned once, without building any nodes, to record the
+        position of every key up to 'index_depth' levels. A lookup parses the smallest indexed subtree containing
+        the property and caches it, so memory grows with the accessed subtrees instead of the file size.
+
+        Documents using anchors and aliases, explicit collection tags, several documents or a root which is not a
+        mapping cannot be split and are loaded completely, like by the PyYAMLPropertySource. So are files with line
+        breaks other than '\n' and '\r\n', whose line numbers would not match the lines of the file. Such a source,
+        like a fully loaded one, can enumerate its properties; otherwise 'property_index' returns None.
+    """
+
+    load_time: Optional[float] = None
+
+    def __init__(self, filename: Path, index_depth: int = 1, order: int = 0) -> None:
+        super().__init__(order)
+        if index_depth < 1:
+            raise ValueError("The index depth must be at least 1")
+        self._filename = filename
+        self._index_depth = index_depth
+        self._spans: Dict[str, _Span] = {}
+        self._expanded: Set[str] = set()
+        self._line_offsets: Dict[int, int] = {}
+        self._line_count = 0
+        self._subtrees: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+        start = time.perf_counter()
+        try:
+            with open(filename, 'rb') as file:
+                self._scan(file)
+            self._find_line_offsets()
+        except _Unsupported:
+            self._spans, self._expanded, self._line_offsets = {}, set(), {}
+            with open(filename, 'rb') as file:
+                self._properties = _parse(file)
+            self._build_index()
+        self.load_time = time.perf_counter() - start
+
+    @property
+    def filename(self) -> Path:
+        return self._filename
+
+    def is_streaming(self) -> bool:
+        """ Returns False if the file could not be split into subtrees and was loaded completely. """
+        return self._index is None
+
+    def loaded_subtrees(self) -> List[str]:
+        return list(self._subtrees)
+
+    def _get(self, name: str) -> Any:
+        if self._index is not None:
+            return super()._get(name)
+
+        parts = name.split(".")
+        subtree_name = parts[0]
+        if subtree_name not in self._spans:
+            raise KeyError(f"Could not find property '{name}'")
+        position = 1
+        while position < len(parts) and subtree_name in self._expanded:
+            child_name = f"{subtree_name}.{parts[position]}"
+            if child_name not in self._spans:
+                raise KeyError(f"Could not find property '{name}'")
+            subtree_name = child_name
+            position += 1
+
+        value = self._subtree(subtree_name)
+        for key in parts[position:]:
+            if not isinstance(value, dict) or key not in value:
+                raise KeyError(f"Could not find property '{name}'")
+            value = value[key]
+        return value
+
+    def _subtree(self, name: str) -> Any:
+        subtree = self._subtrees.get(name, _MISSING)
+        if subtree is not _MISSING:
+            return subtree
+        with self._lock:
+            if name not in self._subtrees:
+                self._subtrees[name] = self._parse_span(self._spans[name])
+            return self._subtrees[name]
+
+    def _parse_span(self, span: _Span) -> Any:
+        start_offset = self._line_offsets[span.start_line]
+        end_offset = self._line_offsets.get(span.end_line + 1)
+        with open(self._filename, 'rb') as file:
+            file.seek(start_offset)
+            content = file.read() if end_offset is None else file.read(end_offset - start_offset)
+
+        lines = content.decode("utf-8").split("\n")[:span.end_line - span.start_line + 1]
+        if span.end_line < self._line_count:
+            # spans closed at the end of the file end on the line after the last one
+            lines[-1] = lines[-1][:span.end_column]
+        lines[0] = lines[0][span.start_column:]
+        if span.block:
+            # lines indented less than the subtree can only be blank or comments
+            lines[1:] = [line[span.start_column:] if not line[:span.start_column].strip() else ""
+                         for line in lines[1:]]
+        return yaml.load("\n".join(lines), Loader=SafeLoader)
+
+    def _scan(self, file) -> None:
+        resolver = Resolver()
+        stack: List[_Frame] = []
+        documents = 0
+        for event in yaml.parse(file, Loader=SafeLoader):
+            event_type = type(event)
+            if event_type is yaml.ScalarEvent:
+                if not stack or event.anchor is not None:
+                    raise _Unsupported()
+                parent = stack[-1]
+                if not parent.is_mapping:
+                    continue
+                if parent.expect_key:
+                    # keys only need to be resolved in mappings whose children are indexed
+                    parent.key = None if parent.prefix is None else self._string_key(resolver, event)
+                elif parent.prefix is not None and parent.key is not None:
+                    self._add_span(f"{parent.prefix}{parent.key}", event.start_mark, event.end_mark, False)
+                parent.expect_key = not parent.expect_key
+                continue
+
+            if event_type is yaml.MappingEndEvent or event_type is yaml.SequenceEndEvent:
+                frame = stack.pop()
+                if frame.name is not None:
+                    self._add_span(frame.name, frame.start_mark, event.end_mark, frame.block)
+                if stack and stack[-1].is_mapping:
+                    parent = stack[-1]
+                    if parent.expect_key:
+                        parent.key = None
+                    parent.expect_key = not parent.expect_key
+                continue
+
+            if event_type is yaml.MappingStartEvent or event_type is yaml.SequenceStartEvent:
+                if event.anchor is not None:
+                    raise _Unsupported()
+                is_mapping = event_type is yaml.MappingStartEvent
+                block = not event.flow_style
+                if not stack:
+                    if not is_mapping or not block:
+                        raise _Unsupported()
+                    stack.append(_Frame(True, "", 0, None, event.start_mark, True))
+                    continue
+
+                parent = stack[-1]
+                name = None
+                if parent.is_mapping and not parent.expect_key and parent.prefix is not None \
+                        and parent.key is not None:
+                    name = f"{parent.prefix}{parent.key}"
+                    if event.tag is not None and not event.implicit:
+                        raise _Unsupported()
+                depth = parent.depth + 1
+                prefix = None
+                if name is not None and is_mapping and block and depth < self._index_depth:
+                    prefix = f"{name}."
+                    self._expanded.add(name)
+                stack.append(_Frame(is_mapping, prefix, depth, name, event.start_mark, block))
+                continue
+
+            if event_type is yaml.AliasEvent:
+                raise _Unsupported()
+            if event_type is yaml.DocumentStartEvent:
+                documents += 1
+                if documents > 1 or event.tags:
+                    raise _Unsupported()
+
+        if documents == 0:
+            raise _Unsupported()
+
+    @staticmethod
+    def _string_key(resolver: Resolver, event: Any) -> Optional[str]:
+        """ Returns the key if it loads as a string which can be addressed with a dotted name. """
+        tag = event.tag
+        if tag is None or tag == "!":
+            tag = resolver.resolve(yaml.ScalarNode, event.value, event.implicit)
+        if tag != _STRING_TAG or event.value == "" or "." in event.value:
+            return None
+        return event.value
+
+    def _add_span(self, name: str, start_mark: Any, end_mark: Any, block: bool) -> None:
+        self._spans[name] = _Span(start_mark.line, start_mark.column, end_mark.line, end_mark.column, block)
+
+    def _find_line_offsets(self) -> None:
+        lines = set()
+        for span in self._spans.values():
+            lines.add(span.start_line)
+            lines.add(span.end_line + 1)
+        offsets = {}
+        offset = 0
+        with open(self._filename, 'rb') as file:
+            number = -1
+            for number, line in enumerate(file):
+                if _OTHER_LINE_BREAKS.search(line):
+                    raise _Unsupported()
+                if number in lines:
+                    offsets[number] = offset
+                offset += len(line)
+        self._line_offsets = offsets
+        self._line_count = number + 1
@@ -1,2 +1,30 @@
-from .converter import T, Converter
-from .property_source import P, PropertySource, OrderedPropertySource
\ No newline at end of file
+from typing import TYPE_CHECKING
+
+from .._lazy_imports import lazy_attributes
+
+if TYPE_CHECKING:
+    from .async_property_source import AsyncPropertySource, AsyncOrderedPropertySource
+    from .converter import T, Converter
+    from .property_source import P, PropertySource, OrderedPropertySource
+
+_IMPORTS = {
+    "AsyncPropertySource": ".async_property_source",
+    "AsyncOrderedPropertySource": ".async_property_source",
+    "T": ".converter",
+    "Converter": ".converter",
+    "P": ".property_source",
+    "PropertySource": ".property_source",
+    "OrderedPropertySource": ".property_source",
+}
+
+__all__ = (
+    "AsyncPropertySource",
+    "AsyncOrderedPropertySource",
+    "T",
+    "Converter",
+    "P",
+    "PropertySource",
+    "OrderedPropertySource",
+)
+
+__getattr__, __dir__ = lazy_attributes(globals(), _IMPORTS)
@@ -0,0 +1,15 @@
+from typing import Protocol
+
+from .property_source import P
+
+
+class AsyncPropertySource(Protocol):
+
+    async def contains_property(self, name: str) -> bool: ...
+
+    async def get_property(self, name: str, clazz: type[P]) -> P: ...
+
+
+class AsyncOrderedPropertySource(AsyncPropertySource):
+
+    def get_order(self) -> int: ...
@@ -0,0 +1,135 @@
+from enum import IntEnum
+from typing import Optional, List
+
+import pytest
+
+from converter.converter_registry import ConverterRegistry
+from converter.default_converter import default_converter, convert
+
+
+class Base:
+    def __init__(self, value):
+        self.value = value.value if isinstance(value, Base) else value
+
+
+class Derived(Base):
+    pass
+
+
+class Port(int):
+    pass
+
+
+class Color(IntEnum):
+    RED = 1
+
+
+def test_should_convert_with_exact_match():
+    # Given
+    registry = ConverterRegistry(default_converter())
+
+    # When
+    value = convert("12", registry, int)
+
+    # Then
+    assert value == 12
+
+
+def test_should_convert_subclass_with_converter_of_base_class():
+    # Given
+    registry = ConverterRegistry({Base: Base})
+
+    # When
+    value = convert("x", registry, Derived)
+
+    # Then
+    assert isinstance(value, Derived)
+    assert value.value == "x"
+
+
+def test_should_convert_int_subclasses_to_the_requested_type():
+    # Given
+    registry = ConverterRegistry(default_converter())
+
+    # When
+    port = convert("8080", registry, Port)
+    color = convert("1", registry, Color)
+
+    # Then
+    assert type(port) is Port and port == 8080
+    assert color is Color.RED
+
+
+def test_should_raise_key_error_if_base_result_does_not_fit_the_subclass():
+    # Given
+    registry = ConverterRegistry(default_converter())
+
+    # When
+    with pytest.raises(KeyError):
+        convert("2", registry, Color)
+
+
+def test_should_convert_optional_type():
+    # Given
+    registry = ConverterRegistry(default_converter())
+
+    # When
+    value = convert("12", registry, Optional[int])
+    none_value = convert(None, registry, Optional[int])
+
+    # Then
+    assert value == 12
+    assert none_value is None
+
+
+def test_should_convert_generic_alias_with_converter_of_origin():
+    # Given
+    registry = ConverterRegistry({list: lambda value: value.split(",")})
+
+    # When
+    value = convert("a,b", registry, List[str])
+
+    # Then
+    assert value == ["a", "b"]
+
+
+def test_should_convert_booleans():
+    # Given
+    registry = ConverterRegistry(default_converter())
+
+    # Then
+    assert convert("true", registry, bool) is True
+    assert convert("No", registry, bool) is False
+    with pytest.raises(KeyError):
+        convert("maybe", registry, bool)
+
+
+def test_should_memoize_resolved_converter_until_next_registration():
+    # Given
+    registry = ConverterRegistry({Base: Base})
+    resolved = registry.get(Derived)
+    assert registry.get(Derived) is resolved
+    assert isinstance(resolved("x"), Derived)
+
+    # When
+    registry.register(Derived, Derived)
+
+    # Then
+    assert registry.get(Derived) is Derived
+
+
+def test_should_raise_key_error_when_no_converter_is_found():
+    # Given
+    registry = ConverterRegistry(default_converter())
+
+    # When
+    with pytest.raises(KeyError):
+        convert("x", registry, Base)
+
+
+def test_should_resolve_converters_of_plain_dictionaries():
+    # When
+    value = convert("x", {Base: Base}, Derived)
+
+    # Then
+    assert value.value == "x"
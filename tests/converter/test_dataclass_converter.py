@@ -1,9 +1,10 @@
 from typing import Optional
 
 import pytest
-from dataclasses import dataclass, is_dataclass
+from dataclasses import dataclass, is_dataclass, field
 
-from converter.dataclass_converter import DataclassConverter
+from converter.dataclass_converter import DataclassConverter, validate_dataclass
+from converter.default_converter import default_converter
 
 import inspect
 from collections import OrderedDict
@@ -125,3 +126,87 @@ def test_should_return_raise_value_error_on_invalid_type_of_key():
             "field_int": 20,
             "field_float": "string is not a float",
         })
+
+
+@dataclass
+class InnerTestDataclass:
+    name: str
+    size: int = 10
+
+
+@dataclass
+class NestedTestDataclass:
+    inner: InnerTestDataclass
+    tags: list = field(default_factory=list)
+    description: Optional[str] = None
+
+
+def test_should_convert_nested_dataclass():
+    # Given
+    converter = DataclassConverter(NestedTestDataclass)
+
+    # When
+    test_dataclass = converter.convert({
+        "inner": {"name": "a name"},
+        "description": "a description",
+    })
+
+    # Then
+    assert test_dataclass.inner == InnerTestDataclass("a name", 10)
+    assert test_dataclass.tags == []
+    assert test_dataclass.description == "a description"
+
+
+def test_should_not_modify_given_properties():
+    # Given
+    converter = DataclassConverter(NestedTestDataclass)
+    properties = {"inner": {"name": "a name"}}
+
+    # When
+    converter.convert(properties)
+
+    # Then
+    assert properties == {"inner": {"name": "a name"}}
+
+
+def test_should_raise_value_error_on_invalid_nested_value():
+    # Given
+    converter = DataclassConverter(NestedTestDataclass)
+
+    # When
+    with pytest.raises(ValueError):
+        converter.convert({"inner": {"name": 1}})
+
+
+def test_should_convert_values_and_collect_errors_when_validating():
+    # Given
+    valid_properties = {"field_str": 1, "field_int": "2", "field_float": None}
+    invalid_properties = {"field_int": "two", "field_float": "three"}
+
+    # When
+    instance, errors = validate_dataclass(OptionalTestDataclass, valid_properties, default_converter())
+    invalid_instance, invalid_errors = validate_dataclass(RegularTestDataclass, invalid_properties,
+                                                          default_converter(), "prefix.")
+
+    # Then
+    assert instance == OptionalTestDataclass("1", 2, None)
+    assert errors == []
+    assert invalid_instance is None
+    assert invalid_errors == ["'prefix.field_str': required key not found",
+                              "'prefix.field_int': cannot convert 'two' to 'int'",
+                              "'prefix.field_float': cannot convert 'three' to 'float'"]
+
+
+def test_should_report_null_values_of_required_fields_when_validating():
+    # Given
+    properties = {"field_str": None, "field_int": 1, "field_float": None}
+
+    # When
+    instance, errors = validate_dataclass(RegularTestDataclass, properties, default_converter())
+    optional_instance, optional_errors = validate_dataclass(OptionalTestDataclass, properties, default_converter())
+
+    # Then
+    assert instance is None
+    assert errors == ["'field_str': required key is null", "'field_float': required key is null"]
+    assert optional_instance == OptionalTestDataclass(None, 1, None)
+    assert optional_errors == []
@@ -0,0 +1,74 @@
+from array import array
+
+import pytest
+
+from converter.default_converter import default_converter, convert
+from converter.numeric_array_converter import IntArray, FloatArray, convert_int_array, convert_float_array, \
+    numeric_array_converter
+
+
+def test_should_convert_numeric_lists_into_compact_arrays():
+    # When
+    ints = convert([1, 2, 3], default_converter(), IntArray)
+    floats = convert([1, 2.5], default_converter(), FloatArray)
+
+    # Then
+    assert ints == array('q', [1, 2, 3])
+    assert floats == array('d', [1.0, 2.5])
+
+
+def test_should_convert_string_elements_and_comma_separated_values():
+    # When
+    from_strings = convert_int_array(["1", "2"])
+    from_text = convert_float_array("1.5, 2, 3")
+
+    # Then
+    assert from_strings == array('q', [1, 2])
+    assert from_text == array('d', [1.5, 2.0, 3.0])
+
+
+def test_should_raise_key_error_for_non_numeric_elements():
+    # When
+    with pytest.raises(KeyError):
+        convert(["one"], default_converter(), IntArray)
+
+
+@pytest.mark.parametrize("value", [[1, 2.5], [1.5], ["1.5"], "1, 2.5"])
+def test_should_reject_non_integral_values_for_int_arrays(value):
+    # When
+    with pytest.raises(KeyError):
+        convert(value, default_converter(), IntArray)
+
+
+def test_should_accept_integral_floats_for_int_arrays():
+    # When
+    ints = convert_int_array([1.0, 2])
+
+    # Then
+    assert ints == array('q', [1, 2])
+
+
+def test_should_not_register_array_converters_for_lists():
+    # Given
+    converter = default_converter()
+
+    # Then
+    assert list[int] not in converter
+    assert list[float] not in converter
+
+
+def test_should_prefer_numpy_when_installed():
+    # Given
+    converter = numeric_array_converter(prefer_numpy=True)
+
+    # When
+    value = converter[FloatArray](["1.5", "2"])
+
+    # Then
+    try:
+        import numpy
+    except ImportError:
+        assert value == array('d', [1.5, 2.0])
+    else:
+        assert value.dtype == numpy.float64
+        assert value.tolist() == [1.5, 2.0]
@@ -92,3 +92,74 @@ def test_should_ignore_invalid_double_dash_assignment():
     # Then
     with pytest.raises(KeyError):
         property_source.get_property("abc", str)
+
+
+def test_should_parse_explicit_argument_list():
+    # When
+    property_source = CLIPropertySource(['--abc=value', '-bcd', 'other value'])
+
+    # Then
+    assert property_source.get_property("abc", str) == "value"
+    assert property_source.get_property("bcd", str) == "other value"
+
+
+def test_should_build_nested_properties_from_dotted_names():
+    # When
+    property_source = CLIPropertySource(['--db.pool.size=10', '--db.host', 'localhost'])
+
+    # Then
+    assert property_source.get_property("db.pool.size", int) == 10
+    assert property_source.get_property("db") == {"pool": {"size": "10"}, "host": "localhost"}
+
+
+def test_should_collect_repeated_arguments_in_list():
+    # When
+    property_source = CLIPropertySource(['--abc=a', '--abc=b', '--abc', 'c'])
+
+    # Then
+    assert property_source.get_property("abc") == ["a", "b", "c"]
+
+
+def test_should_read_arguments_from_response_file(tmp_path):
+    # Given
+    nested_file = tmp_path / "nested.args"
+    nested_file.write_text("--c=3\n")
+    response_file = tmp_path / "overrides.args"
+    response_file.write_text(f"--a=1\n\n--b\n2\n@{nested_file}\n")
+
+    # When
+    property_source = CLIPropertySource([f"@{response_file}", "--d=4"], argument_files=True)
+
+    # Then
+    assert property_source.get_property("a", int) == 1
+    assert property_source.get_property("b", int) == 2
+    assert property_source.get_property("c", int) == 3
+    assert property_source.get_property("d", int) == 4
+
+
+def test_should_raise_value_error_on_recursive_response_file(tmp_path):
+    # Given
+    response_file = tmp_path / "overrides.args"
+    response_file.write_text(f"@{response_file}\n")
+
+    # When
+    with pytest.raises(ValueError):
+        CLIPropertySource([f"@{response_file}"], argument_files=True)
+
+
+def test_should_keep_at_sign_values_unless_argument_files_are_enabled(tmp_path):
+    # Given
+    response_file = tmp_path / "team"
+    response_file.write_text("--a=1\n")
+    argv = ["--handle", "@alice", "--mention=@team", f"@{response_file}"]
+
+    # When
+    plain = CLIPropertySource(argv)
+    with_files = CLIPropertySource(["--handle", f"@{response_file}", f"@{response_file}"], argument_files=True)
+
+    # Then
+    assert plain.get_property("handle") == "@alice"
+    assert plain.get_property("mention") == "@team"
+    assert not plain.contains_property("a")
+    assert with_files.get_property("handle") == f"@{response_file}"
+    assert with_files.get_property("a") == "1"
@@ -0,0 +1,35 @@
+from property_source.compiled_overlay_property_source import CompiledOverlayPropertySource
+from property_source.dictionary_property_source import DictionaryPropertySource
+
+
+def test_should_take_value_of_first_source():
+    # Given
+    first_source = DictionaryPropertySource({"a": "first", "b": {"c": "first"}})
+    second_source = DictionaryPropertySource({"a": "second", "d": "second"})
+
+    # When
+    property_source = CompiledOverlayPropertySource([first_source, second_source])
+
+    # Then
+    assert property_source.get_property("a") == "first"
+    assert property_source.get_property("b.c") == "first"
+    assert property_source.get_property("d") == "second"
+    assert property_source.source_of("a") is first_source
+    assert property_source.source_of("d") is second_source
+
+
+def test_should_recompile_when_source_changes():
+    # Given
+    properties = {"a": "old"}
+    changes = []
+    source = DictionaryPropertySource(properties)
+    property_source = CompiledOverlayPropertySource([source, DictionaryPropertySource({"a": "other", "b": "b"})])
+    property_source.add_change_listener(changes.append)
+
+    # When
+    del properties["a"]
+    source.refresh()
+
+    # Then
+    assert property_source.get_property("a") == "other"
+    assert changes == [{"a"}]
@@ -198,3 +198,87 @@ def test_should_return_correct_converted_datetime():
     # Then
     assert isinstance(value, datetime)
     assert value.year == 2020
+
+
+def test_should_not_see_changes_of_indexed_dictionary():
+    # Given
+    properties = {"a": {"b": "value"}}
+    property_source = DictionaryPropertySource(properties)
+
+    # When
+    properties["c"] = "new value"
+
+    # Then
+    assert property_source.contains_property("a.b")
+    assert not property_source.contains_property("c")
+
+
+def test_should_see_changes_of_mutable_dictionary():
+    # Given
+    properties = {"a": {"b": "value"}}
+    property_source = DictionaryPropertySource(properties, mutable=True)
+
+    # When
+    properties["a"]["c"] = "new value"
+
+    # Then
+    assert property_source.get_property("a.c") == "new value"
+
+
+def test_should_raise_key_error_on_missing_nested_key():
+    # Given
+    property_source = DictionaryPropertySource({
+        "a": {
+            "b": "value"
+        }
+    })
+
+    # When
+    with pytest.raises(KeyError):
+        property_source.get_property("a.b.c")
+
+
+def test_should_not_index_keys_containing_dots():
+    # Given
+    property_source = DictionaryPropertySource({
+        "a.b": "value"
+    })
+
+    # Then
+    assert not property_source.contains_property("a.b")
+
+
+def test_should_record_found_and_missing_properties_when_instrumented():
+    # Given
+    property_source = DictionaryPropertySource({"a": {"b": "1"}})
+    statistics = property_source.enable_instrumentation()
+
+    # When
+    value = property_source.get_property("a.b", int)
+    with pytest.raises(KeyError):
+        property_source.get_property("a.c")
+    stats = statistics.snapshot()
+
+    # Then
+    assert value == 1
+    assert (stats["a.b"].hits, stats["a.b"].misses) == (1, 0)
+    assert (stats["a.c"].hits, stats["a.c"].misses) == (0, 1)
+    assert stats["a.b"].source is property_source
+    assert property_source.stats() == stats
+
+
+def test_should_notify_changed_names_on_refresh():
+    # Given
+    properties = {"db": {"host": "localhost", "port": 5432}, "removed": True, "same": [1, 2]}
+    property_source = DictionaryPropertySource(properties)
+    changes = []
+    property_source.add_change_listener(changes.append)
+
+    # When
+    properties["db"]["port"] = "5432"
+    del properties["removed"]
+    properties["added"] = {}
+    property_source.refresh()
+
+    # Then
+    assert changes == [{"db.port", "removed", "added"}]
@@ -14,3 +14,43 @@ def test_should_return_property_from_environment():
 
     # Then
     assert value == "the value"
+
+
+def test_should_map_prefixed_variables_to_dotted_properties():
+    # Given
+    environment = {"APP_DB_POOL_SIZE": "10", "APP_DB_HOST": "localhost", "APP_MAX__SIZE": "5", "OTHER_VAR": "x"}
+
+    # When
+    with mock.patch.dict(os.environ, environment):
+        property_source = EnvVarsPropertySource(prefix="APP_", snapshot=True)
+
+    # Then
+    assert property_source.get_property("db.pool.size", int) == 10
+    assert property_source.get_property("db") == {"pool": {"size": "10"}, "host": "localhost"}
+    assert property_source.get_property("max_size") == "5"
+    assert not property_source.contains_property("other.var")
+
+
+def test_should_not_see_changes_after_snapshot_until_refresh():
+    # Given
+    with mock.patch.dict(os.environ, {"APP_A": "old"}):
+        property_source = EnvVarsPropertySource(prefix="APP_", snapshot=True)
+
+        # When
+        os.environ["APP_A"] = "new"
+        value_before_refresh = property_source.get_property("a")
+        property_source.refresh()
+
+    # Then
+    assert value_before_refresh == "old"
+    assert property_source.get_property("a") == "new"
+
+
+def test_should_keep_value_of_key_which_is_also_a_parent():
+    # Given
+    with mock.patch.dict(os.environ, {"APP_DB": "value", "APP_DB_POOL": "pool value"}):
+        property_source = EnvVarsPropertySource(prefix="APP_", snapshot=True)
+
+    # Then
+    assert property_source.get_property("db") == "value"
+    assert property_source.get_property("db.pool") == "pool value"
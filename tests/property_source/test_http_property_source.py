@@ -0,0 +1,187 @@
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from context_configuration import ContextConfiguration, ContextConfigurationBuilder
+from property_source.dictionary_property_source import DictionaryPropertySource
+from property_source.http_property_source import HttpPropertySource, StaleConfigurationError
+from property_source.snapshot_property_source import SnapshotPropertySource
+
+
+class ConfigServer:
+
+    def __init__(self, document):
+        self.document = document
+        self.version = 1
+        self.full_responses = 0
+        self.not_modified_responses = 0
+        self.connections = 0
+        self.sockets = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                server.connections += 1
+                server.sockets.append(self.connection)
+
+            def do_GET(self):
+                etag = f'"{server.version}"'
+                if self.headers.get("If-None-Match") == etag:
+                    server.not_modified_responses += 1
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                server.full_responses += 1
+                body = json.dumps(server.document).encode()
+                self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}/config"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def update(self, document):
+        self.document = document
+        self.version += 1
+
+    def shutdown(self):
+        self._server.shutdown()
+        self._server.server_close()
+        for connection in self.sockets:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+@pytest.fixture
+def config_server():
+    server = ConfigServer({"db": {"host": "localhost", "port": 5432}})
+    yield server
+    server.shutdown()
+
+
+def test_should_serve_fetched_document(config_server):
+    # Given
+    property_source = HttpPropertySource(config_server.url, refresh_interval=None)
+
+    # Then
+    assert property_source.get_property("db.host") == "localhost"
+    assert property_source.get_property("db.port", str) == "5432"
+    property_source.close()
+
+
+def test_should_refresh_conditionally_over_one_connection(config_server):
+    # Given
+    property_source = HttpPropertySource(config_server.url, refresh_interval=None)
+
+    # When
+    changed = [property_source.refresh() for _ in range(3)]
+
+    # Then
+    assert changed == [False, False, False]
+    assert config_server.full_responses == 1
+    assert config_server.not_modified_responses == 3
+    assert config_server.connections == 1
+    property_source.close()
+
+
+def test_should_swap_changed_document_and_invalidate_configuration(config_server):
+    # Given
+    property_source = HttpPropertySource(config_server.url, refresh_interval=0.05)
+    configuration = ContextConfiguration([property_source], {})
+    assert configuration.get_property("db.port", int) == 5432
+
+    # When
+    config_server.update({"db": {"host": "localhost", "port": 6543}})
+
+    # Then
+    deadline = time.monotonic() + 5
+    while configuration.get_property("db.port", int) != 6543 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert configuration.get_property("db.port", int) == 6543
+    property_source.close()
+
+
+def test_should_serve_stale_document_within_bound(config_server):
+    # Given
+    property_source = HttpPropertySource(config_server.url, refresh_interval=None, max_staleness=1.5)
+    config_server.shutdown()
+
+    # When
+    with pytest.raises(ConnectionError):
+        property_source.refresh()
+
+    # Then
+    assert property_source.get_property("db.host") == "localhost"
+    time.sleep(1.55 - property_source.staleness())
+    with pytest.raises(StaleConfigurationError):
+        property_source.get_property("db.host")
+    property_source.close()
+
+
+def test_should_stop_serving_cached_values_through_configuration_once_stale(config_server):
+    # Given
+    property_source = HttpPropertySource(config_server.url, refresh_interval=0.05, max_staleness=0.5)
+    configuration = ContextConfiguration([property_source], {})
+    assert configuration.get_property("db.host", str) == "localhost"
+    config_server.shutdown()
+
+    # When
+    time.sleep(0.8)
+
+    # Then
+    with pytest.raises(StaleConfigurationError):
+        configuration.get_property("db.host", str)
+    property_source.close()
+
+
+def test_should_stop_serving_stale_values_through_compiled_overlay(config_server):
+    # Given
+    property_source = HttpPropertySource(config_server.url, refresh_interval=0.05, max_staleness=0.5)
+    configuration = ContextConfigurationBuilder().with_compiled_overlay() \
+        .with_property_source(DictionaryPropertySource({"app": "name"})) \
+        .with_property_source(property_source) \
+        .with_property_source(DictionaryPropertySource({"db": {"user": "admin"}})) \
+        .build()
+    assert configuration.get_property("db.host", str) == "localhost"
+    config_server.shutdown()
+
+    # When
+    time.sleep(0.8)
+
+    # Then
+    assert property_source in configuration.property_sources()
+    with pytest.raises(StaleConfigurationError):
+        configuration.get_property("db.host", str)
+    property_source.close()
+
+
+def test_should_not_freeze_stale_document(config_server, tmp_path):
+    # Given
+    property_source = HttpPropertySource(config_server.url, refresh_interval=None, max_staleness=0.2)
+    config_server.shutdown()
+
+    # When
+    time.sleep(0.25)
+
+    # Then
+    with pytest.raises(StaleConfigurationError):
+        SnapshotPropertySource.freeze([property_source], tmp_path / "snapshot.bin")
+    property_source.close()
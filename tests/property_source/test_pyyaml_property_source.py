@@ -2,6 +2,7 @@ import os
 from pathlib import Path
 
 
+from context_configuration import ContextConfiguration
 from property_source.pyyaml_property_source import PyYAMLPropertySource
 
 PYYAML_TEST_FILE = Path(os.path.dirname(__file__)).joinpath('data').joinpath('pyyaml_test_properties.yaml')
@@ -17,3 +18,58 @@ def test_should_return_correct_value_from_property_without_conversion():
 
     # Then
     assert value == "the value"
+
+
+def test_should_return_nested_map_value():
+    # Given
+    property_source = PyYAMLPropertySource(PYYAML_TEST_FILE)
+
+    # When
+    value = property_source.get_property("key_1")
+
+    # Then
+    assert value == {"key_2": "the value"}
+    assert property_source.contains_property("key_1.key_2")
+    assert not property_source.contains_property("key_1.key_3")
+
+
+def test_should_load_lazily_on_first_access():
+    # Given
+    property_source = PyYAMLPropertySource(PYYAML_TEST_FILE, lazy=True)
+    assert not property_source.is_loaded()
+    assert property_source.load_time is None
+
+    # When
+    value = property_source.get_property("key_1.key_2")
+
+    # Then
+    assert value == "the value"
+    assert property_source.is_loaded()
+    assert property_source.load_time >= 0
+
+
+def test_should_load_lazily_when_checking_for_property():
+    # Given
+    property_source = PyYAMLPropertySource(PYYAML_TEST_FILE, lazy=True)
+
+    # Then
+    assert property_source.contains_property("key_1.key_2")
+    assert not property_source.contains_property("key_3")
+
+
+def test_should_invalidate_only_changed_properties_and_dependents_on_reload(tmp_path):
+    # Given
+    path = tmp_path / "application.yaml"
+    path.write_text("db:\n  host: localhost\n  port: 5432\nurl: postgres://${db.host}\nname: app\n")
+    property_source = PyYAMLPropertySource(path)
+    configuration = ContextConfiguration([property_source], {})
+    for name in ("db.host", "db.port", "url", "name"):
+        configuration.get_property(name, str)
+
+    # When
+    path.write_text("db:\n  host: example.com\n  port: 5432\nurl: postgres://${db.host}\nname: app\n")
+    property_source.reload()
+
+    # Then
+    assert set(configuration._resolution_cache) == {("db.port", str), ("name", str)}
+    assert configuration.get_property("url", str) == "postgres://example.com"
@@ -0,0 +1,71 @@
+from datetime import date
+
+import pytest
+
+from context_configuration import ContextConfiguration
+from property_source.dictionary_property_source import DictionaryPropertySource
+from property_source.env_vars_property_source import EnvVarsPropertySource
+from property_source.snapshot_property_source import SnapshotPropertySource
+
+
+def test_should_serve_properties_from_snapshot(tmp_path):
+    # Given
+    configuration = ContextConfiguration([
+        DictionaryPropertySource({"db": {"host": "localhost", "port": 5432}, "day": date(2020, 1, 22)}),
+    ], {})
+
+    # When
+    property_source = SnapshotPropertySource.freeze(configuration, tmp_path / "config.snapshot")
+
+    # Then
+    assert property_source.get_property("db.host") == "localhost"
+    assert property_source.get_property("db.port") == 5432
+    assert property_source.get_property("day") == date(2020, 1, 22)
+    assert property_source.get_property("db.port", str) == "5432"
+    assert len(property_source) == 4
+
+
+def test_should_merge_sources_with_first_source_winning(tmp_path):
+    # Given
+    sources = [
+        DictionaryPropertySource({"db": {"port": 6543}}),
+        DictionaryPropertySource({"db": {"host": "localhost", "port": 5432}}),
+    ]
+
+    # When
+    property_source = SnapshotPropertySource.freeze(sources, tmp_path / "config.snapshot")
+
+    # Then
+    assert property_source.get_property("db.port") == 6543
+    assert property_source.get_property("db") == {"host": "localhost", "port": 6543}
+
+
+def test_should_attach_to_existing_snapshot(tmp_path):
+    # Given
+    SnapshotPropertySource.freeze([DictionaryPropertySource({"a": "value"})], tmp_path / "config.snapshot")
+
+    # When
+    property_source = SnapshotPropertySource(tmp_path / "config.snapshot")
+    configuration = ContextConfiguration([property_source], {})
+
+    # Then
+    assert configuration.get_property("a", str) == "value"
+    assert not property_source.contains_property("b")
+    with pytest.raises(KeyError):
+        property_source.get_property("b")
+
+
+def test_should_raise_value_error_on_sources_without_index(tmp_path):
+    # When
+    with pytest.raises(ValueError):
+        SnapshotPropertySource.freeze([EnvVarsPropertySource()], tmp_path / "config.snapshot")
+
+
+def test_should_raise_value_error_on_invalid_file(tmp_path):
+    # Given
+    invalid_file = tmp_path / "invalid.snapshot"
+    invalid_file.write_bytes(b"not a snapshot file")
+
+    # When
+    with pytest.raises(ValueError):
+        SnapshotPropertySource(invalid_file)
@@ -0,0 +1,123 @@
+import textwrap
+
+import pytest
+import yaml
+
+from property_source.streaming_pyyaml_property_source import StreamingPyYAMLPropertySource
+
+DOCUMENT = textwrap.dedent("""\
+    # generated configuration
+    service:
+      name: "checkout"   # the service name
+      ports:
+      - 8080
+      - 8081
+    # weights per feature
+    weights:
+      feature_a: 0.25
+    # indented less than the subtree
+      feature_b: 0.75
+      nested:
+        deep: true
+    description: |
+      first line
+      second line
+    flow: {a: 1, b: [x, y]}
+    "quoted": ä-value
+    empty:
+    1: numeric key
+    """)
+
+
+def write_document(tmp_path, content):
+    path = tmp_path / "application-stream.yaml"
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def test_should_return_the_same_values_as_a_full_load(tmp_path):
+    # Given
+    path = write_document(tmp_path, DOCUMENT)
+    expected = yaml.safe_load(DOCUMENT)
+    property_source = StreamingPyYAMLPropertySource(path)
+
+    # When
+    values = {key: property_source.get_property(key) for key in expected if isinstance(key, str)}
+
+    # Then
+    assert property_source.is_streaming()
+    assert values == {key: value for key, value in expected.items() if isinstance(key, str)}
+    assert property_source.get_property("weights.nested.deep") is True
+    assert not property_source.contains_property("1")
+
+
+def test_should_parse_only_the_requested_subtrees(tmp_path):
+    # Given
+    property_source = StreamingPyYAMLPropertySource(write_document(tmp_path, DOCUMENT), index_depth=2)
+
+    # When
+    port = property_source.get_property("service.ports")
+    deep = property_source.get_property("weights.nested.deep")
+
+    # Then
+    assert port == [8080, 8081]
+    assert deep is True
+    assert property_source.loaded_subtrees() == ["service.ports", "weights.nested"]
+    assert property_source.property_index() is None
+
+
+def test_should_not_parse_subtrees_for_missing_indexed_keys(tmp_path):
+    # Given
+    property_source = StreamingPyYAMLPropertySource(write_document(tmp_path, DOCUMENT), index_depth=2)
+
+    # When
+    with pytest.raises(KeyError):
+        property_source.get_property("service.missing.key")
+
+    # Then
+    assert not property_source.contains_property("missing")
+    assert property_source.loaded_subtrees() == []
+
+
+def test_should_load_documents_with_aliases_completely(tmp_path):
+    # Given
+    path = write_document(tmp_path, "defaults: &defaults\n  size: 1\nservice:\n  <<: *defaults\n  name: x\n")
+
+    # When
+    property_source = StreamingPyYAMLPropertySource(path)
+
+    # Then
+    assert not property_source.is_streaming()
+    assert property_source.get_property("service.size") == 1
+    assert property_source.property_index()["service.name"] == "x"
+
+
+@pytest.mark.parametrize("index_depth", [1, 2])
+def test_should_parse_the_last_subtree_of_files_without_trailing_newline(tmp_path, index_depth):
+    # Given
+    path = write_document(tmp_path, "a:\n  x: 1\nb:\n  y: 2")
+    property_source = StreamingPyYAMLPropertySource(path, index_depth=index_depth)
+
+    # When
+    last = property_source.get_property("b")
+    nested = property_source.get_property("b.y")
+
+    # Then
+    assert property_source.is_streaming()
+    assert last == {"y": 2}
+    assert nested == 2
+
+
+@pytest.mark.parametrize("line_break", ["\u0085", "\u2028", "\u2029", "\r"])
+def test_should_load_files_with_other_line_breaks_completely(tmp_path, line_break):
+    # Given
+    content = f"a: \"first{line_break}second\"\nb:\n  y: 2\n"
+    path = write_document(tmp_path, content)
+
+    # When
+    property_source = StreamingPyYAMLPropertySource(path)
+
+    # Then
+    assert not property_source.is_streaming()
+    assert property_source.get_property("a") == yaml.safe_load(content)["a"]
+    assert property_source.get_property("b.y") == 2
@@ -0,0 +1,101 @@
+import asyncio
+import time
+
+import pytest
+
+from async_context_configuration import AsyncContextConfiguration
+from context_configuration import ContextConfiguration
+from property_source.dictionary_property_source import DictionaryPropertySource
+
+
+class SlowAsyncPropertySource:
+
+    def __init__(self, properties, delay=0.1, order=0):
+        self._properties = properties
+        self._delay = delay
+        self._order = order
+        self.calls = 0
+
+    async def contains_property(self, name):
+        self.calls += 1
+        await asyncio.sleep(self._delay)
+        return name in self._properties
+
+    async def get_property(self, name, clazz=None):
+        return self._properties[name]
+
+    def get_order(self):
+        return self._order
+
+
+def test_should_prefer_synchronous_sources():
+    # Given
+    async_source = SlowAsyncPropertySource({"a": "async"})
+    configuration = AsyncContextConfiguration(
+        ContextConfiguration([DictionaryPropertySource({"a": "sync"})], {}), [async_source])
+
+    # When
+    value = asyncio.run(configuration.get_property("a", str))
+
+    # Then
+    assert value == "sync"
+    assert async_source.calls == 0
+
+
+def test_should_fetch_asynchronous_sources_concurrently_in_order():
+    # Given
+    first_source = SlowAsyncPropertySource({"a": "1"}, order=0)
+    second_source = SlowAsyncPropertySource({"a": "2", "b": "2"}, order=1)
+    configuration = AsyncContextConfiguration(ContextConfiguration([], {}), [second_source, first_source])
+
+    # When
+    start = time.perf_counter()
+    values = asyncio.run(configuration.get_properties([("a", int), ("b", int)]))
+    duration = time.perf_counter() - start
+
+    # Then
+    assert values == [1, 2]
+    assert duration < 0.18
+
+
+def test_should_share_resolved_values_with_synchronous_cache():
+    # Given
+    async_source = SlowAsyncPropertySource({"a": "42"})
+    synchronous_configuration = ContextConfiguration([], {})
+    configuration = AsyncContextConfiguration(synchronous_configuration, [async_source])
+    asyncio.run(configuration.get_property("a", int))
+
+    # When
+    value = asyncio.run(configuration.get_property("a", int))
+
+    # Then
+    assert value == 42
+    assert async_source.calls == 1
+    assert synchronous_configuration.get_property("a", int) == 42
+
+
+def test_should_raise_key_error_on_missing_property():
+    # Given
+    configuration = AsyncContextConfiguration(ContextConfiguration([], {}), [SlowAsyncPropertySource({}, delay=0)])
+
+    # When
+    with pytest.raises(KeyError):
+        asyncio.run(configuration.get_property("a", str))
+
+
+def test_should_interpolate_async_values_like_synchronous_ones():
+    # Given
+    properties = {"host": "localhost"}
+    synchronous_configuration = ContextConfiguration([DictionaryPropertySource(properties, mutable=True)], {})
+    configuration = AsyncContextConfiguration(synchronous_configuration,
+                                              [SlowAsyncPropertySource({"url": "db://${host}"}, delay=0)])
+
+    # When
+    first = asyncio.run(configuration.get_property("url", str))
+    properties["host"] = "remote"
+    synchronous_configuration.invalidate_cache("host")
+    second = asyncio.run(configuration.get_property("url", str))
+
+    # Then
+    assert first == "db://localhost"
+    assert second == "db://remote"
@@ -0,0 +1,810 @@
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+from unittest import mock
+
+import pytest
+
+from context_configuration import ContextConfiguration, ContextConfigurationBuilder, Dependency, Property, \
+    SchemaValidationError
+from converter.numeric_array_converter import IntArray
+from memoized_scope import MemoizedScope
+from property_source.compiled_overlay_property_source import CompiledOverlayPropertySource
+from property_source.dictionary_property_source import DictionaryPropertySource
+from property_source.env_vars_property_source import EnvVarsPropertySource
+from property_source.pyyaml_property_source import PyYAMLPropertySource
+
+
+def test_should_return_property_from_first_source_containing_it():
+    # Given
+    first_source = DictionaryPropertySource({"a": "first"})
+    second_source = DictionaryPropertySource({"a": "second", "b": "second"})
+    configuration = ContextConfiguration([first_source, second_source], {})
+
+    # When
+    resolution_a = configuration.get_resolution("a", str)
+    resolution_b = configuration.get_resolution("b", str)
+
+    # Then
+    assert resolution_a.value == "first"
+    assert resolution_a.source is first_source
+    assert resolution_b.value == "second"
+    assert resolution_b.source is second_source
+
+
+def test_should_convert_property_once_and_cache_it():
+    # Given
+    calls = []
+
+    def convert_to_list(value):
+        calls.append(value)
+        return value.split(",")
+
+    configuration = ContextConfiguration([DictionaryPropertySource({"a": "x,y"})], {list: convert_to_list})
+
+    # When
+    first = configuration.get_property("a", list)
+    second = configuration.get_property("a", list)
+
+    # Then
+    assert first == ["x", "y"]
+    assert first is second
+    assert calls == ["x,y"]
+
+
+def test_should_cache_per_requested_type():
+    # Given
+    configuration = ContextConfiguration([DictionaryPropertySource({"a": "1"})], {})
+
+    # When
+    as_int = configuration.get_property("a", int)
+    as_str = configuration.get_property("a", str)
+
+    # Then
+    assert as_int == 1
+    assert as_str == "1"
+
+
+def test_should_raise_key_error_on_missing_property():
+    # Given
+    configuration = ContextConfiguration([DictionaryPropertySource({"a": "1"})], {})
+
+    # When
+    with pytest.raises(KeyError):
+        configuration.get_property("b", str)
+
+
+def test_should_invalidate_cache_when_source_changes():
+    # Given
+    properties = {"a": "old"}
+    property_source = DictionaryPropertySource(properties)
+    configuration = ContextConfiguration([property_source], {})
+    assert configuration.get_property("a", str) == "old"
+
+    # When
+    properties["a"] = "new"
+    property_source.refresh()
+
+    # Then
+    assert configuration.get_property("a", str) == "new"
+
+
+def test_should_invalidate_single_property():
+    # Given
+    properties = {"a": "old", "b": "old"}
+    property_source = DictionaryPropertySource(properties, mutable=True)
+    configuration = ContextConfiguration([property_source], {})
+    configuration.get_property("a", str)
+    configuration.get_property("b", str)
+
+    # When
+    properties["a"] = "new"
+    properties["b"] = "new"
+    configuration.invalidate_cache("a")
+
+    # Then
+    assert configuration.get_property("a", str) == "new"
+    assert configuration.get_property("b", str) == "old"
+
+
+@dataclass
+class PoolTestDataclass:
+    size: int
+    timeout: float
+    name: str = "default"
+
+
+@dataclass
+class DatabaseTestDataclass:
+    url: str
+    pool: PoolTestDataclass
+
+
+@dataclass
+class FeatureTestDataclass:
+    enabled: str
+    name: str
+
+
+@dataclass
+class RetryTestDataclass:
+    attempts: Optional[int]
+    backoff: float
+
+
+def test_should_resolve_properties_in_batch():
+    # Given
+    configuration = ContextConfiguration([
+        DictionaryPropertySource({"a": "1"}),
+        DictionaryPropertySource({"a": "2", "b": "2.5", "c": "value"}),
+    ], {})
+
+    # When
+    values = configuration.get_properties([("a", int), ("b", float), ("c", str)])
+
+    # Then
+    assert values == [1, 2.5, "value"]
+    assert configuration.get_resolution("b", float).value == 2.5
+
+
+def test_should_raise_key_error_on_missing_properties_in_batch():
+    # Given
+    configuration = ContextConfiguration([DictionaryPropertySource({"a": "1"})], {})
+
+    # When
+    with pytest.raises(KeyError):
+        configuration.get_properties([("a", int), ("b", int)])
+
+
+def test_should_bind_merged_subtree_to_dataclass():
+    # Given
+    configuration = ContextConfiguration([
+        DictionaryPropertySource({"db": {"pool": {"size": 20}}}),
+        DictionaryPropertySource({"db": {"pool": {"size": 10, "timeout": 2.5}}}),
+    ], {})
+
+    # When
+    pool = configuration.bind("db.pool", PoolTestDataclass)
+
+    # Then
+    assert pool == PoolTestDataclass(20, 2.5)
+    assert configuration.bind("db.pool", PoolTestDataclass) is pool
+
+
+def test_should_raise_key_error_when_binding_missing_prefix():
+    # Given
+    configuration = ContextConfiguration([DictionaryPropertySource({"a": "1"})], {})
+
+    # When
+    with pytest.raises(KeyError):
+        configuration.bind("db.pool", PoolTestDataclass)
+
+
+def test_should_pass_properties_to_bean():
+    # Given
+    configuration = ContextConfiguration([DictionaryPropertySource({"a": "x", "b": "y"})], {})
+
+    @configuration.properties([Property("first", "a", str), Property("second", "b", str)], is_singleton=True)
+    def bean(first, second):
+        return first, second
+
+    # When
+    first, second = bean()
+
+    # Then
+    assert first == "x"
+    assert second == "y"
+
+
+def test_should_construct_singleton_once_under_concurrent_access():
+    # Given
+    configuration = ContextConfiguration([DictionaryPropertySource({"a": "x"})], {})
+    constructions = []
+    barrier = threading.Barrier(64)
+    results = []
+
+    @configuration.properties([Property("value", "a", str)], is_singleton=True)
+    def bean(value):
+        constructions.append(value)
+        time.sleep(0.01)
+        return object()
+
+    def access():
+        barrier.wait()
+        results.append(bean())
+
+    # When
+    threads = [threading.Thread(target=access) for _ in range(64)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Then
+    assert len(constructions) == 1
+    assert len(results) == 64
+    assert all(result is results[0] for result in results)
+
+
+def test_should_not_share_singletons_between_configurations():
+    # Given
+    first_configuration = ContextConfiguration([DictionaryPropertySource({"a": "first"})], {})
+    second_configuration = ContextConfiguration([DictionaryPropertySource({"a": "second"})], {})
+
+    def bean(value):
+        return value
+
+    # When
+    first_bean = first_configuration.properties([Property("value", "a", str)])(bean)
+    second_bean = second_configuration.properties([Property("value", "a", str)])(bean)
+
+    # Then
+    assert first_bean() == "first"
+    assert second_bean() == "second"
+
+
+def test_should_interpolate_placeholders_across_sources():
+    # Given
+    configuration = ContextConfiguration([
+        DictionaryPropertySource({"url": "jdbc://${db.host}:${db.port}/${db.name:app}"}),
+        DictionaryPropertySource({"db": {"host": "localhost", "port": 5432}}),
+    ], {})
+
+    # When
+    url = configuration.get_property("url", str)
+
+    # Then
+    assert url == "jdbc://localhost:5432/app"
+
+
+def test_should_keep_type_of_single_placeholder():
+    # Given
+    configuration = ContextConfiguration([DictionaryPropertySource({"port": "${db.port}", "db": {"port": 5432}})], {})
+
+    # When
+    value = configuration.get_resolution("port", int)
+
+    # Then
+    assert value.value == 5432
+
+
+def test_should_invalidate_only_dependents_of_changed_property():
+    # Given
+    properties = {"host": "old", "url": "http://${host}", "other": "${name}", "name": "value"}
+    configuration = ContextConfiguration([DictionaryPropertySource(properties, mutable=True)], {})
+    assert configuration.get_property("url", str) == "http://old"
+    assert configuration.get_property("other", str) == "value"
+
+    # When
+    properties["host"] = "new"
+    properties["name"] = "new value"
+    configuration.invalidate_cache("host")
+
+    # Then
+    assert configuration.get_property("url", str) == "http://new"
+    assert configuration.get_property("other", str) == "value"
+
+
+def test_should_detect_placeholder_cycles_on_construction():
+    # When
+    with pytest.raises(ValueError, match="a -> b -> c -> a"):
+        ContextConfiguration([DictionaryPropertySource({"a": "${b}", "b": "x${c}", "c": "${a}"})], {})
+
+
+def test_should_raise_key_error_on_unresolvable_placeholder():
+    # Given
+    configuration = ContextConfiguration([DictionaryPropertySource({"a": "${missing}"})], {})
+
+    # When
+    with pytest.raises(KeyError):
+        configuration.get_property("a", str)
+
+
+def test_should_interpolate_bound_subtree():
+    # Given
+    configuration = ContextConfiguration([DictionaryPropertySource({
+        "defaults": {"size": 20},
+        "db": {"pool": {"size": "${defaults.size}", "timeout": 2.5}},
+    })], {})
+
+    # When
+    pool = configuration.bind("db.pool", PoolTestDataclass)
+
+    # Then
+    assert pool == PoolTestDataclass(20, 2.5)
+
+
+class OrderedDictionaryPropertySource(DictionaryPropertySource):
+
+    def __init__(self, properties, order):
+        super().__init__(properties)
+        self._order = order
+
+
+def test_should_respect_order_of_property_sources():
+    # Given
+    configuration = ContextConfiguration([
+        OrderedDictionaryPropertySource({"a": "low precedence"}, order=10),
+        OrderedDictionaryPropertySource({"a": "high precedence"}, order=1),
+    ], {})
+
+    # When
+    value = configuration.get_property("a", str)
+
+    # Then
+    assert value == "high precedence"
+
+
+def test_should_compile_static_sources_around_dynamic_source():
+    # Given
+    first_source = OrderedDictionaryPropertySource({"a": "first"}, order=0)
+    second_source = OrderedDictionaryPropertySource({"a": "second", "b": "second"}, order=1)
+    dynamic_source = OrderedDictionaryPropertySource({"b": "dynamic", "c": "dynamic"}, order=2)
+    third_source = OrderedDictionaryPropertySource({"c": "third", "d": "third"}, order=3)
+
+    # When
+    configuration = (ContextConfigurationBuilder()
+                     .with_property_source(third_source)
+                     .with_property_source(dynamic_source, dynamic=True)
+                     .with_property_source(second_source)
+                     .with_property_source(first_source)
+                     .with_compiled_overlay()
+                     .build())
+
+    # Then
+    sources = configuration.property_sources()
+    assert len(sources) == 3
+    assert isinstance(sources[0], CompiledOverlayPropertySource)
+    assert sources[1] is dynamic_source
+    assert sources[2] is third_source
+    assert configuration.get_property("a", str) == "first"
+    assert configuration.get_property("b", str) == "second"
+    assert configuration.get_property("c", str) == "dynamic"
+    assert configuration.get_property("d", str) == "third"
+    assert configuration.get_resolution("b", str).source is second_source
+
+
+def test_should_not_share_state_between_builders():
+    # Given
+    ContextConfigurationBuilder().with_property_source(DictionaryPropertySource({"a": "first"})).build()
+
+    # When
+    configuration = ContextConfigurationBuilder().with_converter((list, lambda value: [value])).build()
+
+    # Then
+    assert configuration.property_sources() == []
+
+
+def test_should_record_hits_misses_and_source_when_instrumented():
+    # Given
+    first_source = DictionaryPropertySource({"a": "1"})
+    second_source = DictionaryPropertySource({"b": "2"})
+    configuration = ContextConfiguration([first_source, second_source], {})
+    events = []
+    configuration.enable_instrumentation(events.append)
+
+    # When
+    configuration.get_property("a", int)
+    configuration.get_property("a", int)
+    configuration.get_properties([("a", int), ("b", str)])
+    stats = configuration.stats()
+
+    # Then
+    assert (stats["a"].hits, stats["a"].misses) == (2, 1)
+    assert stats["a"].source is first_source
+    assert (stats["b"].hits, stats["b"].misses) == (0, 1)
+    assert stats["b"].source is second_source
+    assert stats["a"].lookup_time > 0 and stats["a"].conversion_time > 0
+    assert [(event.name, event.hit) for event in events] == [("a", False), ("a", True), ("a", True), ("b", False)]
+
+
+def test_should_restore_plain_lookups_when_instrumentation_is_disabled():
+    # Given
+    configuration = ContextConfiguration([DictionaryPropertySource({"a": "1"})], {})
+    configuration.enable_instrumentation()
+
+    # When
+    configuration.disable_instrumentation()
+    value = configuration.get_property("a", int)
+
+    # Then
+    assert value == 1
+    assert configuration.stats() == {}
+    assert "get_property" not in vars(configuration)
+
+
+def test_should_rebuild_memoized_bean_only_when_property_values_change():
+    # Given
+    properties = {"tenant": "first"}
+    source = DictionaryPropertySource(properties)
+    configuration = ContextConfiguration([source], {})
+    scope = MemoizedScope()
+    constructions = []
+
+    @configuration.properties([Property("tenant", "tenant", str)], is_singleton=False, scope=scope)
+    def client(tenant):
+        constructions.append(tenant)
+        return object()
+
+    # When
+    first = client()
+    second = client()
+    properties["tenant"] = "second"
+    source.refresh()
+    third = client()
+
+    # Then
+    assert first is second
+    assert third is not first
+    assert constructions == ["first", "second"]
+    assert (scope.hits, scope.misses) == (1, 2)
+
+
+def test_should_evict_least_recently_used_instance():
+    # Given
+    scope = MemoizedScope(max_size=2)
+    scope.get("a", object)
+    b = scope.get("b", object)
+    scope.get("a", object)
+
+    # When
+    scope.get("c", object)
+
+    # Then
+    assert len(scope) == 2
+    assert scope.evictions == 1
+    assert scope.get("b", object) is not b
+
+
+def test_should_rebuild_memoized_instance_after_ttl():
+    # Given
+    scope = MemoizedScope(ttl=0.05)
+    first = scope.get("a", object)
+
+    # When
+    time.sleep(0.06)
+    second = scope.get("a", object)
+
+    # Then
+    assert second is not first
+    assert scope.evictions == 1
+
+
+def test_should_reject_scope_for_singleton_beans():
+    # Given
+    configuration = ContextConfiguration([DictionaryPropertySource({"a": "x"})], {})
+
+    # When
+    with pytest.raises(ValueError):
+        configuration.properties([Property("value", "a", str)], scope=MemoizedScope())
+
+
+def test_should_inject_bean_dependencies_by_bean_and_by_name():
+    # Given
+    configuration = ContextConfiguration([DictionaryPropertySource({"url": "db://", "size": "5"})], {})
+
+    @configuration.properties([Property("url", "url", str)])
+    def connection(url):
+        return f"connection to {url}"
+
+    @configuration.properties([Property("size", "size", int)], dependencies=[Dependency("connection", connection)])
+    def pool(size, connection):
+        return [connection] * size
+
+    @configuration.properties([], dependencies=[Dependency("pool", "pool")])
+    def repository(pool):
+        return len(pool)
+
+    # When
+    size = repository()
+
+    # Then
+    assert size == 5
+    assert pool()[0] is connection()
+
+
+def test_should_detect_circular_bean_dependencies():
+    # Given
+    configuration = ContextConfiguration([], {})
+
+    @configuration.properties([], dependencies=[Dependency("second", "second")])
+    def first(second):
+        return second
+
+    @configuration.properties([], dependencies=[Dependency("first", first)])
+    def second(first):
+        return first
+
+    # When
+    with pytest.raises(ValueError, match="Circular bean dependencies"):
+        first()
+    with pytest.raises(ValueError, match="Circular bean dependencies"):
+        configuration.warm_up()
+
+
+def test_should_warm_up_independent_beans_concurrently_after_their_dependencies():
+    # Given
+    configuration = ContextConfiguration([], {})
+    constructed = []
+
+    def slow_bean(name):
+        time.sleep(0.1)
+        constructed.append(name)
+        return name
+
+    @configuration.properties([])
+    def first():
+        return slow_bean("first")
+
+    @configuration.properties([])
+    def second():
+        return slow_bean("second")
+
+    @configuration.properties([], dependencies=[Dependency("first", first), Dependency("second", second)])
+    def third(first, second):
+        constructed.append("third")
+        return first + second
+
+    @configuration.properties([], is_singleton=False)
+    def prototype():
+        constructed.append("prototype")
+
+    # When
+    start = time.perf_counter()
+    construction_times = configuration.warm_up()
+    duration = time.perf_counter() - start
+
+    # Then
+    assert set(construction_times) == {"first", "second", "third"}
+    assert construction_times["first"] >= 0.1
+    assert constructed[2] == "third"
+    assert "prototype" not in constructed
+    assert duration < 0.18
+    assert third() == "firstsecond"
+
+
+def test_should_store_validated_schema_values_pre_typed():
+    # Given
+    source = DictionaryPropertySource({"db": {"url": "db://", "pool": {"size": "20", "timeout": "2.5"}}})
+    builder = ContextConfigurationBuilder().with_property_source(source) \
+        .with_schema("db", DatabaseTestDataclass)
+
+    # When
+    configuration = builder.build()
+
+    # Then
+    assert configuration.get_resolution("db.pool.size", int) == (20, source)
+    assert configuration.get_property("db.pool.timeout", float) == 2.5
+    assert configuration.bind("db.pool", PoolTestDataclass) == PoolTestDataclass(20, 2.5)
+    assert configuration.bind("db", DatabaseTestDataclass).pool is configuration.bind("db.pool", PoolTestDataclass)
+    assert ("db.pool.name", str) not in configuration._resolution_cache
+
+
+def test_should_convert_schema_values_when_binding_after_a_change():
+    # Given
+    properties = {"db": {"url": "db://", "pool": {"size": "20", "timeout": "2.5"}}}
+    source = DictionaryPropertySource(properties, mutable=True)
+    configuration = ContextConfigurationBuilder().with_property_source(source) \
+        .with_schema("db", DatabaseTestDataclass) \
+        .build()
+    configuration.bind("db", DatabaseTestDataclass)
+
+    # When
+    properties["db"]["pool"]["size"] = "30"
+    source.refresh()
+    database = configuration.bind("db", DatabaseTestDataclass)
+    pool = configuration.bind("db.pool", PoolTestDataclass)
+
+    # Then
+    assert database == DatabaseTestDataclass("db://", PoolTestDataclass(30, 2.5))
+    assert pool == PoolTestDataclass(30, 2.5)
+
+
+def test_should_report_schema_errors_when_binding_after_a_change():
+    # Given
+    properties = {"db": {"url": "db://", "pool": {"size": "20", "timeout": "2.5"}}}
+    source = DictionaryPropertySource(properties, mutable=True)
+    configuration = ContextConfigurationBuilder().with_property_source(source) \
+        .with_schema("db", DatabaseTestDataclass) \
+        .build()
+
+    # When
+    properties["db"]["pool"]["size"] = "many"
+    source.refresh()
+    with pytest.raises(SchemaValidationError) as error:
+        configuration.bind("db", DatabaseTestDataclass)
+
+    # Then
+    assert error.value.errors == ["'db.pool.size': cannot convert 'many' to 'int'"]
+
+
+def test_should_resolve_null_schema_values_like_without_schema():
+    # Given
+    source = DictionaryPropertySource({"retry": {"attempts": None, "backoff": "0.5"}})
+    configuration = ContextConfigurationBuilder().with_property_source(source) \
+        .with_schema("retry", RetryTestDataclass) \
+        .build()
+
+    # When
+    with pytest.raises(KeyError):
+        configuration.get_property("retry.attempts", int)
+
+    # Then
+    assert configuration.bind("retry", RetryTestDataclass) == RetryTestDataclass(None, 0.5)
+    assert configuration.get_property("retry.backoff", float) == 0.5
+
+
+def test_should_report_all_schema_errors_on_build():
+    # Given
+    builder = ContextConfigurationBuilder() \
+        .with_property_source(DictionaryPropertySource({"db": {"pool": {"size": "many", "timeout": "soon"}}})) \
+        .with_schema("db", DatabaseTestDataclass) \
+        .with_schema("cache", PoolTestDataclass)
+
+    # When
+    with pytest.raises(SchemaValidationError) as error:
+        builder.build()
+
+    # Then
+    assert error.value.errors == [
+        "'db.url': required key not found",
+        "'db.pool.size': cannot convert 'many' to 'int'",
+        "'db.pool.timeout': cannot convert 'soon' to 'float'",
+        "'cache': required key not found",
+    ]
+
+
+def test_should_convert_numeric_list_once_per_key():
+    # Given
+    configuration = ContextConfiguration([DictionaryPropertySource({"weights": [1, 2, 3]})], {})
+
+    # When
+    first = configuration.get_property("weights", IntArray)
+    second = configuration.get_property("weights", IntArray)
+
+    # Then
+    assert first.typecode == "q"
+    assert list(first) == [1, 2, 3]
+    assert first is second
+
+
+def test_should_invalidate_parents_and_children_of_a_property():
+    # Given
+    properties = {"db": {"host": "a"}}
+    configuration = ContextConfiguration([DictionaryPropertySource(properties, mutable=True)], {})
+    configuration.get_property("db", str)
+    configuration.get_property("db.host", str)
+
+    # When
+    properties["db"] = {"host": "b"}
+    configuration.invalidate_cache("db.host")
+    parent = configuration.get_property("db", str)
+    properties["db"] = {"host": "c"}
+    configuration.invalidate_cache("db")
+    child = configuration.get_property("db.host", str)
+
+    # Then
+    assert parent == "{'host': 'b'}"
+    assert child == "c"
+
+
+def test_should_keep_escaped_placeholders_literal():
+    # Given
+    configuration = ContextConfiguration([DictionaryPropertySource({"password": "ab$${cd}ef", "user": "u"})], {})
+
+    # When
+    password = configuration.get_property("password", str)
+
+    # Then
+    assert password == "ab${cd}ef"
+
+
+def test_should_invalidate_properties_referencing_a_parent_of_the_changed_property():
+    # Given
+    properties = {"db": {"host": "a"}, "copy": "${db.host}"}
+    configuration = ContextConfiguration([DictionaryPropertySource(properties, mutable=True)], {})
+    configuration.get_property("copy", str)
+
+    # When
+    properties["db"] = {"host": "b"}
+    configuration.invalidate_cache("db")
+
+    # Then
+    assert configuration.get_property("copy", str) == "b"
+
+
+def test_should_not_load_lazy_sources_when_compiling_overlay(tmp_path):
+    # Given
+    path = tmp_path / "application-lazy.yaml"
+    path.write_text("lazy:\n  value: 1\n")
+    lazy_source = PyYAMLPropertySource(path, lazy=True)
+    builder = ContextConfigurationBuilder().with_compiled_overlay() \
+        .with_property_source(DictionaryPropertySource({"a": "1"})) \
+        .with_property_source(DictionaryPropertySource({"b": "2"})) \
+        .with_property_source(lazy_source)
+
+    # When
+    configuration = builder.build()
+
+    # Then
+    assert not lazy_source.is_loaded()
+    assert lazy_source in configuration.property_sources()
+    assert configuration.get_property("lazy.value", int) == 1
+
+
+def test_should_read_the_live_environment_on_every_lookup():
+    # Given
+    configuration = ContextConfiguration([EnvVarsPropertySource(), DictionaryPropertySource({"FOO": "default"})], {})
+
+    with mock.patch.dict(os.environ):
+        os.environ.pop("FOO", None)
+        cached = configuration.get_property("FOO", str)
+
+        # When
+        os.environ["FOO"] = "first"
+        first = configuration.get_property("FOO", str)
+        os.environ["FOO"] = "second"
+        second = configuration.get_property("FOO", str)
+        del os.environ["FOO"]
+        removed = configuration.get_property("FOO", str)
+
+    # Then
+    assert (cached, first, second, removed) == ("default", "first", "second", "default")
+
+
+def test_should_not_cache_placeholders_resolved_from_the_live_environment():
+    # Given
+    configuration = ContextConfiguration([EnvVarsPropertySource(),
+                                          DictionaryPropertySource({"url": "http://${HOST:localhost}"})], {})
+    first = configuration.get_property("url", str)
+
+    # When
+    with mock.patch.dict(os.environ, {"HOST": "example.com"}):
+        second = configuration.get_property("url", str)
+
+    # Then
+    assert first == "http://localhost"
+    assert second == "http://example.com"
+
+
+def test_should_read_dynamic_sources_on_every_lookup():
+    # Given
+    environment = {"feature": {"enabled": "false"}}
+    configuration = ContextConfigurationBuilder().with_compiled_overlay() \
+        .with_property_source(DictionaryPropertySource(environment, mutable=True), dynamic=True) \
+        .with_property_source(DictionaryPropertySource({"feature": {"enabled": "true", "name": "a"}})) \
+        .with_property_source(DictionaryPropertySource({"other": "value"})) \
+        .build()
+    first = configuration.get_property("feature.enabled", bool)
+
+    # When
+    environment["feature"]["enabled"] = "true"
+    second = configuration.get_property("feature.enabled", bool)
+    bound = configuration.bind("feature", FeatureTestDataclass)
+    environment["feature"]["name"] = "b"
+    renamed = configuration.bind("feature", FeatureTestDataclass)
+
+    # Then
+    assert (first, second) == (False, True)
+    assert bound == FeatureTestDataclass("true", "a")
+    assert renamed == FeatureTestDataclass("true", "b")
+
+
+def test_should_read_the_environment_through_an_overlay_after_the_first_lookup():
+    # Given
+    with mock.patch.dict(os.environ, {"HOST": "first"}):
+        configuration = ContextConfigurationBuilder().with_compiled_overlay() \
+            .with_property_source(EnvVarsPropertySource(), dynamic=True) \
+            .with_property_source(DictionaryPropertySource({"HOST": "localhost"})) \
+            .with_property_source(DictionaryPropertySource({"port": 80})) \
+            .build()
+        first = configuration.get_property("HOST", str)
+
+        # When
+        os.environ["HOST"] = "second"
+        second = configuration.get_property("HOST", str)
+
+    # Then
+    assert (first, second) == ("first", "second")
@@ -0,0 +1,49 @@
+import pytest
+
+from default_property_source_loader import DefaultPropertySourcesLoader
+
+
+def write_profiles(directory, count):
+    for number in range(count):
+        (directory / f"application-p{number}.yaml").write_text(f"profile: p{number}\nvalue_{number}: {number}\n")
+
+
+def test_should_load_profiles_in_given_order(tmp_path):
+    # Given
+    write_profiles(tmp_path, 8)
+    profiles = [f"p{number}" for number in reversed(range(8))]
+
+    # When
+    loader = DefaultPropertySourcesLoader(profiles, config_directory=str(tmp_path))
+
+    # Then
+    sources = loader.get_property_sources()
+    assert [source.get_property("profile") for source in sources] == profiles
+    assert len(loader.load_times) == 8
+    assert all(load_time >= 0 for load_time in loader.load_times.values())
+
+
+def test_should_not_share_property_sources_between_loaders(tmp_path):
+    # Given
+    write_profiles(tmp_path, 2)
+
+    # When
+    first_loader = DefaultPropertySourcesLoader(["p0"], config_directory=str(tmp_path))
+    second_loader = DefaultPropertySourcesLoader(["p1"], config_directory=str(tmp_path))
+
+    # Then
+    assert len(first_loader.get_property_sources()) == 1
+    assert len(second_loader.get_property_sources()) == 1
+
+
+def test_should_report_all_missing_profiles(tmp_path):
+    # Given
+    write_profiles(tmp_path, 1)
+
+    # When
+    with pytest.raises(FileNotFoundError) as error:
+        DefaultPropertySourcesLoader(["p0", "missing_a", "missing_b"], config_directory=str(tmp_path))
+
+    # Then
+    assert "'missing_a'" in str(error.value)
+    assert "'missing_b'" in str(error.value)
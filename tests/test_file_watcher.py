@@ -0,0 +1,72 @@
+import time
+
+import pytest
+
+from context_configuration import ContextConfiguration
+from file_watcher import FileWatcher
+from property_source.pyyaml_property_source import PyYAMLPropertySource
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_should_reload_changed_file_and_invalidate_configuration(tmp_path, use_inotify):
+    # Given
+    config_file = tmp_path / "application.yaml"
+    config_file.write_text("a:\n  b: old\n")
+    property_source = PyYAMLPropertySource(config_file)
+    configuration = ContextConfiguration([property_source], {})
+    assert configuration.get_property("a.b", str) == "old"
+
+    with FileWatcher(interval=0.05, debounce=0.05, use_inotify=use_inotify) as watcher:
+        watcher.watch_source(property_source)
+
+        # When
+        config_file.write_text("a:\n  b: new value\n")
+
+        # Then
+        assert wait_for(lambda: configuration.get_property("a.b", str) == "new value")
+
+
+def test_should_debounce_burst_of_writes(tmp_path):
+    # Given
+    config_file = tmp_path / "application.yaml"
+    config_file.write_text("a: 0\n")
+    calls = []
+    watcher = FileWatcher(interval=0.02, debounce=0.3, use_inotify=False)
+    watcher.watch(config_file, lambda: calls.append(config_file.read_text()))
+
+    with watcher:
+        # When
+        for value in range(1, 6):
+            config_file.write_text(f"a: {value}{' ' * value}\n")
+            time.sleep(0.02)
+
+        # Then
+        assert wait_for(lambda: len(calls) == 1)
+        time.sleep(0.4)
+    assert calls == ["a: 5     \n"]
+
+
+def test_should_keep_previous_properties_on_invalid_file(tmp_path):
+    # Given
+    config_file = tmp_path / "application.yaml"
+    config_file.write_text("a: valid\n")
+    property_source = PyYAMLPropertySource(config_file)
+    watcher = FileWatcher(debounce=0)
+    watcher.watch_source(property_source)
+
+    # When
+    config_file.write_text("a: [unclosed\n")
+    watcher.check()
+    watcher.check()
+
+    # Then
+    assert property_source.get_property("a") == "valid"
@@ -0,0 +1,29 @@
+from interpolation import Placeholder, compile_template
+
+
+def test_should_return_none_without_placeholders():
+    # Then
+    assert compile_template("plain value") is None
+    assert compile_template("unterminated ${value") is None
+
+
+def test_should_compile_literals_and_placeholders():
+    # When
+    template = compile_template("jdbc://${db.host}:${db.port:5432}/db")
+
+    # Then
+    assert template == ("jdbc://", Placeholder("db.host", None), ":", Placeholder("db.port", "5432"), "/db")
+
+
+def test_should_reuse_compiled_template():
+    # Then
+    assert compile_template("${a}") is compile_template("${a}")
+
+
+def test_should_unescape_literal_placeholder_syntax():
+    # When
+    template = compile_template("ab$${cd}ef ${x}")
+
+    # Then
+    assert template == ("ab${", "cd}ef ", Placeholder("x", None))
+    assert compile_template("only $${literal}") == ("only ${", "literal}")
@@ -0,0 +1,53 @@
+import os
+import subprocess
+import sys
+
+SOURCE_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+
+def run_python(statement: str) -> str:
+    environment = dict(os.environ, PYTHONPATH=SOURCE_DIRECTORY)
+    return subprocess.run([sys.executable, "-c", statement], env=environment, capture_output=True, text=True,
+                          check=True).stdout.strip()
+
+
+def test_should_not_import_yaml_when_only_environment_variables_are_used():
+    # When
+    output = run_python("import sys\n"
+                        "from context_configuration import EnvVarsPropertySource\n"
+                        "print(EnvVarsPropertySource.__name__, 'yaml' in sys.modules, 'datetime' in sys.modules)")
+
+    # Then
+    assert output == "EnvVarsPropertySource False False"
+
+
+def test_should_resolve_every_exported_name():
+    # When
+    output = run_python("import context_configuration\n"
+                        "from context_configuration import *\n"
+                        "print(all(name in dir(context_configuration) for name in context_configuration.__all__))")
+
+    # Then
+    assert output == "True"
+
+
+def test_should_not_shadow_exported_functions_by_their_modules():
+    # When
+    output = run_python("import context_configuration.context_configuration\n"
+                        "from context_configuration.converter import default_converter, numeric_array_converter\n"
+                        "print(callable(default_converter), callable(numeric_array_converter))")
+
+    # Then
+    assert output == "True True"
+
+
+def test_should_list_every_lazily_imported_name_in_all():
+    # When
+    output = run_python("import context_configuration.converter as converter\n"
+                        "import context_configuration.property_source as property_source\n"
+                        "import context_configuration.protocol as protocol\n"
+                        "print(all(set(package.__all__) == set(package._IMPORTS)\n"
+                        "          for package in (converter, property_source, protocol)))")
+
+    # Then
+    assert output == "True"
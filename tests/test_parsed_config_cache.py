@@ -0,0 +1,86 @@
+import os
+
+import yaml
+
+from parsed_config_cache import ParsedConfigCache
+from property_source.pyyaml_property_source import PyYAMLPropertySource
+
+
+def write(path, content, mtime_ns=None):
+    path.write_text(content)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_should_parse_on_miss_and_reuse_on_hit(tmp_path):
+    # Given
+    config_file = tmp_path / "application.yaml"
+    write(config_file, "a:\n  b: 1\n")
+    cache = ParsedConfigCache(tmp_path / "cache")
+    calls = []
+
+    def parse(content):
+        calls.append(content)
+        return yaml.safe_load(content)
+
+    # When
+    first = cache.load(config_file, parse)
+    second = ParsedConfigCache(tmp_path / "cache").load(config_file, parse)
+
+    # Then
+    assert first == {"a": {"b": 1}}
+    assert second == first
+    assert len(calls) == 1
+    assert cache.misses == 1
+
+
+def test_should_rebuild_stale_entry(tmp_path):
+    # Given
+    config_file = tmp_path / "application.yaml"
+    write(config_file, "a: 1\n", mtime_ns=1_000_000_000)
+    cache = ParsedConfigCache(tmp_path / "cache")
+    cache.load(config_file, yaml.safe_load)
+
+    # When
+    write(config_file, "a: 2\n", mtime_ns=1_000_000_000)
+    tree = cache.load(config_file, yaml.safe_load)
+
+    # Then
+    assert tree == {"a": 2}
+    assert cache.misses == 2
+    assert cache.hits == 0
+
+
+def test_should_evict_least_recently_used_entries(tmp_path):
+    # Given
+    cache = ParsedConfigCache(tmp_path / "cache", max_size=1)
+    first_file = tmp_path / "first.yaml"
+    second_file = tmp_path / "second.yaml"
+    write(first_file, "a: 1\n")
+    write(second_file, "b: 2\n")
+
+    # When
+    cache.load(first_file, yaml.safe_load)
+    entry = os.path.join(cache.directory, os.listdir(cache.directory)[0])
+    os.utime(entry, ns=(0, 0))
+    cache.load(second_file, yaml.safe_load)
+
+    # Then
+    assert len(os.listdir(cache.directory)) == 1
+    cache.load(second_file, yaml.safe_load)
+    assert cache.hits == 1
+
+
+def test_should_load_yaml_property_source_through_cache(tmp_path):
+    # Given
+    config_file = tmp_path / "application.yaml"
+    write(config_file, "key_1:\n  key_2: the value\n")
+    cache = ParsedConfigCache(tmp_path / "cache")
+    PyYAMLPropertySource(config_file, cache=cache)
+
+    # When
+    property_source = PyYAMLPropertySource(config_file, cache=cache)
+
+    # Then
+    assert property_source.get_property("key_1.key_2") == "the value"
+    assert cache.hits == 1